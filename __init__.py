@@ -7,13 +7,24 @@
 """
 
 import logging
-import threading
-import time
 import asyncio
 import aiohttp
 import os
+import json
+import functools
+import uuid
+import time
+import threading
+import hashlib
+from collections.abc import Mapping
 from pathlib import Path
 
+# orjson parses/serializes request and response bodies in C - fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ModelLinker")
@@ -22,6 +33,20 @@ logger.setLevel(logging.INFO)
 # Track active downloads for cancellation
 active_downloads = {}
 
+# Download tuning: read/write in 1 MiB chunks, publish at most ~200 progress updates per file
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PROGRESS_UPDATES_PER_FILE = 200
+
+# Bytes between progress updates when the server sends no Content-Length
+UNKNOWN_SIZE_PROGRESS_STEP = 8 * 1024 * 1024
+
+# Max concurrent downloads within one batch request
+BATCH_DOWNLOAD_CONCURRENCY = 4
+
+
+class DownloadIncompleteError(Exception):
+    """The response ended before the whole file arrived (the partial file is kept for resuming)."""
+
 # Web directory for JavaScript interface
 WEB_DIRECTORY = "./web"
 
@@ -34,6 +59,62 @@ __all__ = ["WEB_DIRECTORY", "NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS"]
 # Track if routes have been set up
 _routes_registered = False
 
+# Delayed registration: retry every 0.5s for up to 30 seconds
+REGISTRATION_RETRY_INTERVAL = 0.5
+REGISTRATION_MAX_ATTEMPTS = 60
+
+# Serialized /model_linker/models body for the current cache version: (etag, bytes)
+_models_response_cache = None
+
+# Shared HTTP session for downloads (created lazily, closed on server shutdown)
+_session = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it on first use.
+    Reusing one session lets downloads share pooled keep-alive connections.
+    """
+    global _session
+    
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300),
+            # No overall/read timeout - multi-GB models can take a long time
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=None)
+        )
+    return _session
+
+
+async def _close_session(app):
+    """Close the shared download session when the server shuts down."""
+    global _session
+    
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def _json_default(obj):
+    """Serialize mapping records (scanner.ModelRec) as plain JSON objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def register_api_routes():
     """
@@ -70,248 +151,563 @@ def register_api_routes():
     
     # Import core modules
     try:
-        from .core.linker import analyze_and_find_matches, apply_resolution
-        from .core.scanner import get_model_files
+        from .core.linker import analyze_and_find_matches, apply_resolution_patch
+        from .core.scanner import get_model_files, get_model_cache_info
     except ImportError as e:
         logger.error(f"Model Linker: Could not import core modules: {e}")
         return False
     
+    def _api_route(handler):
+        """Wrap a route handler with shared error handling (logged, returned as a 500 JSON error)."""
+        @functools.wraps(handler)
+        async def wrapper(request):
+            try:
+                return await handler(request)
+            except web.HTTPException:
+                raise
+            except Exception as e:
+                logger.error(f"Model Linker {handler.__name__} error: {e}", exc_info=True)
+                return _jr({'error': str(e), 'success': False}, status=500)
+        return wrapper
+    
+    async def _json(request):
+        """Parse the request body as JSON (faster than request.json())."""
+        return _loads(await request.read())
+    
+    def _jr(obj, status: int = 200, headers: dict = None):
+        """Build a JSON response (drop-in for web.json_response)."""
+        return web.Response(body=_dumps(obj), status=status, content_type='application/json', headers=headers)
+    
     # Define route handlers
+    @_api_route
     async def analyze_workflow(request):
         """Analyze workflow and return missing models with matches."""
-        try:
-            data = await request.json()
-            workflow_json = data.get('workflow')
-            
-            if not workflow_json:
-                return web.json_response({'error': 'Workflow JSON is required'}, status=400)
-            
-            result = analyze_and_find_matches(workflow_json)
-            return web.json_response(result)
-        except Exception as e:
-            logger.error(f"Model Linker analyze error: {e}", exc_info=True)
-            return web.json_response({'error': str(e)}, status=500)
+        data = await _json(request)
+        workflow_json = data.get('workflow')
+        
+        if not workflow_json:
+            return _jr({'error': 'Workflow JSON is required'}, status=400)
+        
+        result = analyze_and_find_matches(workflow_json)
+        return _jr(result)
     
+    @_api_route
     async def resolve_models(request):
-        """Apply model resolution and return updated workflow."""
-        try:
-            data = await request.json()
-            workflow_json = data.get('workflow')
-            resolutions = data.get('resolutions', [])
-            
-            if not workflow_json:
-                return web.json_response({'error': 'Workflow JSON is required'}, status=400)
-            
-            if not resolutions:
-                return web.json_response({'error': 'Resolutions array is required'}, status=400)
-            
-            updated_workflow = apply_resolution(workflow_json, resolutions)
-            return web.json_response({'workflow': updated_workflow, 'success': True})
-        except Exception as e:
-            logger.error(f"Model Linker resolve error: {e}", exc_info=True)
-            return web.json_response({'error': str(e), 'success': False}, status=500)
+        """Apply model resolution and return the changes as a JSON Patch (RFC 6902)."""
+        data = await _json(request)
+        workflow_json = data.get('workflow')
+        resolutions = data.get('resolutions', [])
+        
+        if not workflow_json:
+            return _jr({'error': 'Workflow JSON is required'}, status=400)
+        
+        if not resolutions:
+            return _jr({'error': 'Resolutions array is required'}, status=400)
+        
+        # Only the changed widget values go back over the wire, not the whole workflow
+        patch = apply_resolution_patch(workflow_json, resolutions)
+        return _jr({'patch': patch, 'success': True})
     
+    @_api_route
     async def get_models(request):
-        """Get list of all available models. Uses in-memory cache for speed."""
-        try:
-            # Check if cache refresh is requested
-            use_cache = request.query.get('use_cache', 'true').lower() != 'false'
-            force_refresh = request.query.get('refresh', 'false').lower() == 'true'
-            models = get_model_files(use_cache=use_cache, force_refresh=force_refresh)
-            return web.json_response(models)
-        except Exception as e:
-            logger.error(f"Model Linker get_models error: {e}", exc_info=True)
-            return web.json_response({'error': str(e)}, status=500)
+        """
+        Get list of all available models. Uses in-memory cache for speed.
+        Cached responses carry an ETag so clients can revalidate with If-None-Match.
+        """
+        global _models_response_cache
+        
+        # Check if cache refresh is requested
+        use_cache = request.query.get('use_cache', 'true').lower() != 'false'
+        force_refresh = request.query.get('refresh', 'false').lower() == 'true'
+        models = get_model_files(use_cache=use_cache, force_refresh=force_refresh)
+        
+        if not use_cache:
+            return _jr(models)
+        
+        # The ETag changes whenever the in-memory cache is rebuilt
+        cache_info = get_model_cache_info()
+        version = f"{cache_info['last_updated']}-{cache_info['count']}".encode()
+        etag = f'"{hashlib.blake2b(version, digest_size=8).hexdigest()}"'
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+        
+        # Serialize once per cache version and reuse the bytes
+        if _models_response_cache is None or _models_response_cache[0] != etag:
+            _models_response_cache = (etag, _dumps(models))
+        
+        return web.Response(body=_models_response_cache[1], content_type='application/json', headers=headers)
     
+    @_api_route
     async def refresh_cache(request):
         """Force refresh the in-memory model cache."""
-        try:
-            from .core.scanner import clear_model_cache, get_model_files
-            
-            logger.info("Model Linker: Manual cache refresh requested")
-            clear_model_cache()
-            models = get_model_files(use_cache=True, force_refresh=True)
-            
-            return web.json_response({
-                'success': True,
-                'models_found': len(models),
-                'message': f'Cache refreshed with {len(models)} models'
-            })
-        except Exception as e:
-            logger.error(f"Model Linker refresh_cache error: {e}", exc_info=True)
-            return web.json_response({'error': str(e), 'success': False}, status=500)
+        from .core.scanner import clear_model_cache, get_model_files
+        
+        logger.info("Model Linker: Manual cache refresh requested")
+        clear_model_cache()
+        models = get_model_files(use_cache=True, force_refresh=True)
+        
+        return _jr({
+            'success': True,
+            'models_found': len(models),
+            'message': f'Cache refreshed with {len(models)} models'
+        })
     
+    @_api_route
     async def health_check(request):
         """Health check endpoint to verify Model Linker is running."""
-        return web.json_response({'status': 'ok', 'version': '2.2.0'})
+        return _jr({'status': 'ok', 'version': '2.2.0'})
     
+    @_api_route
     async def download_model(request):
         """Download a model from a URL with progress tracking."""
-        try:
-            data = await request.json()
-            url = data.get('url')
-            category = data.get('category', 'checkpoints')
-            filename = data.get('filename')
-            download_id = data.get('download_id')
-            
-            if not url or not filename or not download_id:
-                return web.json_response({'error': 'url, filename, and download_id are required'}, status=400)
-            
-            # Determine destination path based on category
-            import folder_paths
-            model_dirs = folder_paths.get_folder_paths(category)
-            if not model_dirs:
-                return web.json_response({'error': f'No directory found for category: {category}'}, status=400)
-            
-            dest_dir = Path(model_dirs[0])
-            dest_path = dest_dir / filename
-            
-            # Check if file already exists
-            if dest_path.exists():
-                return web.json_response({'error': 'File already exists', 'path': str(dest_path)}, status=409)
-            
-            # Create directory if it doesn't exist
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Start download in background
-            download_task = asyncio.create_task(
-                _download_file_with_progress(url, dest_path, download_id)
-            )
+        data = await _json(request)
+        url = data.get('url')
+        category = data.get('category', 'checkpoints')
+        filename = data.get('filename')
+        download_id = data.get('download_id')
+        
+        if not url or not filename or not download_id:
+            return _jr({'error': 'url, filename, and download_id are required'}, status=400)
+        
+        # Determine destination path based on category
+        dest_path = _get_download_destination(category, filename)
+        if dest_path is None:
+            return _jr({'error': f'No directory found for category: {category}'}, status=400)
+        
+        # Check if file already exists
+        if dest_path.exists():
+            return _jr({'error': 'File already exists', 'path': str(dest_path)}, status=409)
+        
+        # Create directory if it doesn't exist
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Store download state for progress polling and cancellation
+        progress = {'downloaded': 0, 'total': 0, 'percent': 0}
+        download_info = {
+            'task': None,
+            'cancel_event': asyncio.Event(),
+            'progress': progress,
+            'progress_bytes': _progress_body(progress)
+        }
+        active_downloads[download_id] = download_info
+        
+        # Start download in background
+        download_info['task'] = asyncio.create_task(
+            _download_file_with_progress(url, dest_path, download_info)
+        )
+        
+        return _jr({
+            'success': True,
+            'download_id': download_id,
+            'destination': str(dest_path)
+        })
+    
+    @_api_route
+    async def download_batch(request):
+        """Download several models concurrently, tracked as a single batch."""
+        data = await _json(request)
+        tasks = data.get('tasks')
+        batch_id = data.get('batch_id') or uuid.uuid4().hex
+        
+        if not tasks or not isinstance(tasks, list):
+            return _jr({'error': 'tasks array is required'}, status=400)
+        
+        if batch_id in active_downloads:
+            return _jr({'error': 'Batch already exists', 'batch_id': batch_id}, status=409)
+        
+        # One cancel event for the whole batch - cancelling the batch stops every child
+        cancel_event = asyncio.Event()
+        batch_info = {
+            'task': None,
+            'cancel_event': cancel_event,
+            'total': len(tasks),
+            'succeeded': 0,
+            'failed': 0,
+            'children': {}
+        }
+        
+        downloads = []
+        for index, task in enumerate(tasks):
+            # A non-object entry is reported as a failed child with no url/filename
+            if not isinstance(task, dict):
+                task = {}
+            url = task.get('url')
+            filename = task.get('filename')
+            category = task.get('category', 'checkpoints')
             
-            # Store task for cancellation
-            active_downloads[download_id] = {
-                'task': download_task,
-                'cancelled': False,
+            # Children are keyed by position so client ids can't collide with each other or an index
+            child = {
+                'filename': filename,
+                'status': 'queued',
+                'cancel_event': cancel_event,
                 'progress': {'downloaded': 0, 'total': 0, 'percent': 0}
             }
+            if task.get('download_id') is not None:
+                child['download_id'] = task['download_id']
+            batch_info['children'][str(index)] = child
             
-            return web.json_response({
-                'success': True,
-                'download_id': download_id,
-                'destination': str(dest_path)
-            })
-        except Exception as e:
-            logger.error(f"Model Linker download error: {e}", exc_info=True)
-            return web.json_response({'error': str(e)}, status=500)
+            # Invalid entries fail individually instead of rejecting the whole batch
+            valid = all(isinstance(value, str) and value for value in (url, filename, category))
+            try:
+                dest_path = _get_download_destination(category, filename) if valid else None
+                if dest_path is None:
+                    child['error'] = 'url, filename and a valid category are required'
+                elif dest_path.exists():
+                    child['error'] = 'File already exists'
+                else:
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    child['destination'] = str(dest_path)
+                    downloads.append((url, dest_path, child))
+                    continue
+            except Exception as e:
+                child['error'] = str(e)
+            child['status'] = 'failed'
+            batch_info['failed'] += 1
+        
+        active_downloads[batch_id] = batch_info
+        
+        semaphore = asyncio.Semaphore(BATCH_DOWNLOAD_CONCURRENCY)
+        batch_info['task'] = asyncio.gather(
+            *[_guarded_download(semaphore, batch_info, *download) for download in downloads]
+        )
+        # A cancelled batch leaves CancelledError on the gather future - retrieve it so asyncio doesn't log it
+        batch_info['task'].add_done_callback(lambda task: task.cancelled() or task.exception())
+        
+        return _jr({
+            'success': True,
+            'batch_id': batch_id,
+            'children': {
+                child_id: {k: v for k, v in child.items()
+                           if k in ('download_id', 'filename', 'status', 'destination', 'error')}
+                for child_id, child in batch_info['children'].items()
+            }
+        })
+    
+    @_api_route
+    async def get_batch_progress(request):
+        """Get aggregate progress of a batch download (one poll for all children)."""
+        batch_id = request.match_info.get('batch_id')
+        
+        batch_info = active_downloads.get(batch_id)
+        if batch_info is None or 'children' not in batch_info:
+            return _jr({'error': 'Batch not found'}, status=404)
+        
+        cancelled = batch_info['cancel_event'].is_set()
+        if batch_info['task'].done():
+            status = 'cancelled' if cancelled or batch_info['task'].cancelled() else 'completed'
+            del active_downloads[batch_id]
+        elif cancelled:
+            status = 'cancelling'
+        else:
+            status = 'downloading'
+        
+        downloaded = 0
+        total = 0
+        children = {}
+        for child_id, child in batch_info['children'].items():
+            progress = child['progress']
+            downloaded += progress['downloaded']
+            total += progress['total']
+            # Children still waiting on the semaphore were cancelled before they started
+            child_status = child['status']
+            if status == 'cancelled' and child_status in ('queued', 'downloading'):
+                child_status = 'cancelled'
+            children[child_id] = {'status': child_status, 'progress': progress}
+            for key in ('download_id', 'error'):
+                if key in child:
+                    children[child_id][key] = child[key]
+        
+        return _jr({
+            'status': status,
+            'total': batch_info['total'],
+            'succeeded': batch_info['succeeded'],
+            'failed': batch_info['failed'],
+            'progress': {
+                'downloaded': downloaded,
+                'total': total,
+                'percent': int(downloaded / total * 100) if total > 0 else 0
+            },
+            'children': children
+        })
     
+    @_api_route
     async def get_download_progress(request):
         """Get progress of an active download."""
-        try:
-            download_id = request.match_info.get('download_id')
-            
-            if download_id not in active_downloads:
-                return web.json_response({'error': 'Download not found'}, status=404)
-            
-            download_info = active_downloads[download_id]
-            progress = download_info['progress']
-            
-            # Check if download is complete
-            if download_info['task'].done():
-                try:
-                    result = download_info['task'].result()
-                    del active_downloads[download_id]
-                    return web.json_response({
-                        'status': 'completed',
-                        'success': True,
-                        'result': result
-                    })
-                except Exception as e:
-                    del active_downloads[download_id]
-                    return web.json_response({
-                        'status': 'failed',
-                        'error': str(e)
-                    })
-            
-            return web.json_response({
-                'status': 'downloading' if not download_info['cancelled'] else 'cancelling',
-                'progress': progress
-            })
-        except Exception as e:
-            logger.error(f"Model Linker progress error: {e}", exc_info=True)
-            return web.json_response({'error': str(e)}, status=500)
+        download_id = request.match_info.get('download_id')
+        
+        # Batches are reported by get_batch_progress
+        if download_id not in active_downloads or 'children' in active_downloads[download_id]:
+            return _jr({'error': 'Download not found'}, status=404)
+        
+        download_info = active_downloads[download_id]
+        progress = download_info['progress']
+        
+        # Check if download is complete
+        if download_info['task'].done():
+            # result() would raise CancelledError, which isn't an Exception
+            if download_info['task'].cancelled():
+                del active_downloads[download_id]
+                return _jr({'status': 'cancelled'})
+            try:
+                result = download_info['task'].result()
+                del active_downloads[download_id]
+                return _jr({
+                    'status': 'completed',
+                    'success': True,
+                    'result': result
+                })
+            except Exception as e:
+                del active_downloads[download_id]
+                return _jr({
+                    'status': 'failed',
+                    'error': str(e)
+                })
+        
+        if download_info['cancel_event'].is_set():
+            return _jr({'status': 'cancelling', 'progress': progress})
+        
+        # Pre-serialized by the download loop - no per-poll JSON encoding
+        return web.Response(body=download_info['progress_bytes'], content_type='application/json')
     
+    @_api_route
     async def cancel_download(request):
         """Cancel an active download."""
-        try:
-            download_id = request.match_info.get('download_id')
-            
-            if download_id not in active_downloads:
-                return web.json_response({'error': 'Download not found'}, status=404)
-            
-            download_info = active_downloads[download_id]
-            download_info['cancelled'] = True
-            download_info['task'].cancel()
-            
-            return web.json_response({'success': True, 'message': 'Download cancelled'})
-        except Exception as e:
-            logger.error(f"Model Linker cancel error: {e}", exc_info=True)
-            return web.json_response({'error': str(e)}, status=500)
+        download_id = request.match_info.get('download_id')
+        
+        if download_id not in active_downloads:
+            return _jr({'error': 'Download not found'}, status=404)
+        
+        download_info = active_downloads[download_id]
+        download_info['cancel_event'].set()
+        download_info['task'].cancel()
+        
+        return _jr({'success': True, 'message': 'Download cancelled'})
     
-    async def _download_file_with_progress(url: str, dest_path: Path, download_id: str):
-        """Download a file with progress tracking."""
+    async def _download_file_with_progress(url: str, dest_path: Path, download_info: dict):
+        """Download a file with progress tracking (reported into download_info['progress'])."""
         # IMPORTANT: Download to .tmp file first to prevent partial files from being detected!
         temp_path = dest_path.with_suffix(dest_path.suffix + '.tmp')
+        # URL and version (ETag/Last-Modified) the .tmp belongs to - checked before resuming
+        meta_path = dest_path.with_suffix(dest_path.suffix + '.tmp.meta')
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to download: HTTP {response.status}")
-                    
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
-                    
-                    # Update progress info
-                    if download_id in active_downloads:
-                        active_downloads[download_id]['progress']['total'] = total_size
-                    
-                    # Download to TEMP file first
-                    with open(temp_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            # Check if cancelled
-                            if download_id in active_downloads and active_downloads[download_id]['cancelled']:
-                                # Close and delete temp file
-                                f.close()
-                                if temp_path.exists():
-                                    temp_path.unlink()
-                                logger.info(f"Download cancelled, temp file deleted: {temp_path}")
-                                raise asyncio.CancelledError("Download cancelled by user")
-                            
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            # Update progress
-                            if download_id in active_downloads:
-                                progress = active_downloads[download_id]['progress']
-                                progress['downloaded'] = downloaded
-                                progress['total'] = total_size
-                                progress['percent'] = int((downloaded / total_size * 100)) if total_size > 0 else 0
-                    
-                    # Only rename to final name if download completed successfully!
-                    if downloaded == total_size or total_size == 0:
-                        temp_path.rename(dest_path)
-                        logger.info(f"Download complete, renamed {temp_path} -> {dest_path}")
-                    else:
-                        # Incomplete download - delete temp file
-                        if temp_path.exists():
-                            temp_path.unlink()
-                        raise Exception(f"Download incomplete: {downloaded}/{total_size} bytes")
-                    
-                    return {'path': str(dest_path), 'size': downloaded}
-                    
+            # Reuse the shared session (keep-alive + connection pooling across downloads)
+            session = await _get_session()
+            
+            # Resume a partial .tmp left behind by an interrupted download of the same file.
+            # If-Range makes the server send the whole file instead if it changed since the HEAD
+            start, validator = await _get_resume_offset(session, url, temp_path, meta_path)
+            headers = {'Range': f'bytes={start}-', 'If-Range': validator} if start else {}
+            
+            async with session.get(url, headers=headers) as response:
+                if start and response.status == 206 and _content_range_start(response) == start:
+                    logger.info(f"Resuming download at {start} bytes: {temp_path}")
+                elif response.status == 200:
+                    # Full body (no usable partial file, or the server ignored the Range header)
+                    start = 0
+                else:
+                    raise Exception(f"Failed to download: HTTP {response.status}")
+                
+                total_size = start + int(response.headers.get('content-length', 0))
+                if not start:
+                    _write_resume_meta(meta_path, url, response, total_size)
+                downloaded = start
+                last_reported = start
+                report_step = total_size // PROGRESS_UPDATES_PER_FILE if total_size else UNKNOWN_SIZE_PROGRESS_STEP
+                
+                # Bind progress/cancel state once so the chunk loop only touches locals
+                progress = download_info['progress']
+                cancel_event = download_info['cancel_event']
+                progress['total'] = total_size
+                
+                # Download to TEMP file first (raw fd - O_BINARY matters on Windows)
+                flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+                flags |= os.O_APPEND if start else os.O_TRUNC
+                fd = os.open(temp_path, flags, 0o644)
+                try:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        # Check if cancelled (temp file is deleted by the handler below)
+                        if cancel_event.is_set():
+                            logger.info(f"Download cancelled, deleting temp file: {temp_path}")
+                            raise asyncio.CancelledError("Download cancelled by user")
+                        
+                        _write_all(fd, chunk)
+                        downloaded += len(chunk)
+                        
+                        # Update progress (throttled - not on every chunk)
+                        if downloaded - last_reported > report_step:
+                            _update_progress(download_info, downloaded, total_size)
+                            last_reported = downloaded
+                finally:
+                    os.close(fd)
+                
+                _update_progress(download_info, downloaded, total_size)
+                
+                # Only rename to final name if download completed successfully!
+                if downloaded == total_size or total_size == 0:
+                    temp_path.rename(dest_path)
+                    _remove_files(meta_path)
+                    logger.info(f"Download complete, renamed {temp_path} -> {dest_path}")
+                else:
+                    # Short read - the except block below keeps the temp file for resuming
+                    raise DownloadIncompleteError(f"Download incomplete: {downloaded}/{total_size} bytes")
+                
+                return {'path': str(dest_path), 'size': downloaded}
+                
         except asyncio.CancelledError:
             # Ensure temp file is deleted on cancellation
-            if temp_path.exists():
-                temp_path.unlink()
+            if _remove_files(temp_path, meta_path):
                 logger.info(f"Cancelled: Temp file cleaned up: {temp_path}")
             raise
+        except (aiohttp.ClientError, asyncio.TimeoutError, DownloadIncompleteError):
+            # Connection dropped or body cut short - keep the partial so the next attempt
+            # resumes it (unless it can't be validated, in which case it's useless)
+            if meta_path.exists():
+                logger.warning(f"Download interrupted, keeping partial file for resume: {temp_path}")
+            elif _remove_files(temp_path):
+                logger.error(f"Download interrupted, temp file deleted (no resume info): {temp_path}")
+            raise
         except Exception as e:
             # Clean up temp file on any error
-            if temp_path.exists():
-                temp_path.unlink()
+            if _remove_files(temp_path, meta_path):
                 logger.error(f"Error during download, temp file deleted: {temp_path}")
             raise
     
+    async def _guarded_download(semaphore: asyncio.Semaphore, batch_info: dict, url: str, dest_path: Path, child: dict):
+        """Run one batch download under the batch semaphore and record its outcome."""
+        async with semaphore:
+            child['status'] = 'downloading'
+            try:
+                await _download_file_with_progress(url, dest_path, child)
+            except asyncio.CancelledError:
+                child['status'] = 'cancelled'
+                raise
+            except Exception as e:
+                logger.error(f"Model Linker batch item failed ({dest_path.name}): {e}")
+                child['status'] = 'failed'
+                child['error'] = str(e)
+                batch_info['failed'] += 1
+            else:
+                child['status'] = 'completed'
+                batch_info['succeeded'] += 1
+    
+    def _get_download_destination(category: str, filename: str):
+        """Get the destination path for a download, or None if the category has no directory."""
+        import folder_paths
+        try:
+            model_dirs = folder_paths.get_folder_paths(category)
+        except KeyError:
+            # get_folder_paths raises for categories ComfyUI doesn't know
+            return None
+        if not model_dirs:
+            return None
+        return Path(model_dirs[0]) / filename
+    
+    async def _get_resume_offset(session: aiohttp.ClientSession, url: str, temp_path: Path,
+                                 meta_path: Path) -> tuple:
+        """
+        Get the byte offset to resume a download from, or 0 to start over.
+        Only resumes when a partial temp file exists whose resume info (see
+        _write_resume_meta) names the same URL, and a HEAD request shows the server
+        accepts byte ranges and still has the same version (validator and size) of the file.
+        
+        Returns:
+            (offset, validator for the If-Range header) - (0, None) to start over
+        """
+        if not temp_path.exists() or not meta_path.exists():
+            return 0, None
+        
+        partial_size = temp_path.stat().st_size
+        try:
+            meta = _loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            return 0, None
+        if partial_size == 0 or not isinstance(meta, dict) or meta.get('url') != url:
+            return 0, None
+        
+        try:
+            async with session.head(url, allow_redirects=True) as head:
+                accept_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+                expected_size = int(head.headers.get('content-length', 0))
+                validator = _resume_validator(head.headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.debug(f"Model Linker: HEAD request failed, not resuming: {e}")
+            return 0, None
+        
+        # A different version of the file can't be continued from our bytes
+        if validator is None or validator != meta.get('validator') or expected_size != meta.get('size'):
+            logger.info(f"Model Linker: Partial download is from another version of the file, restarting: {temp_path}")
+            return 0, None
+        
+        if accept_ranges and partial_size < expected_size:
+            return partial_size, validator
+        return 0, None
+    
+    def _resume_validator(headers) -> str:
+        """Get the value usable in If-Range for a response: a strong ETag, else Last-Modified (or None)."""
+        etag = headers.get('etag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return headers.get('last-modified')
+    
+    def _write_resume_meta(meta_path: Path, url: str, response: aiohttp.ClientResponse, total_size: int):
+        """Record which URL and version the .tmp being written belongs to (none if unverifiable)."""
+        validator = _resume_validator(response.headers)
+        if validator and total_size:
+            meta_path.write_bytes(_dumps({'url': url, 'validator': validator, 'size': total_size}))
+        else:
+            _remove_files(meta_path)
+    
+    def _content_range_start(response: aiohttp.ClientResponse) -> int:
+        """Get the first byte offset of a 206 response's Content-Range (-1 if missing or malformed)."""
+        content_range = response.headers.get('content-range', '')
+        try:
+            return int(content_range.split(' ', 1)[1].split('-', 1)[0])
+        except (IndexError, ValueError):
+            return -1
+    
+    def _remove_files(*paths: Path) -> bool:
+        """Delete the given files if they exist. Returns True if any was deleted."""
+        removed = False
+        for path in paths:
+            try:
+                path.unlink()
+                removed = True
+            except FileNotFoundError:
+                pass
+        return removed
+    
+    def _write_all(fd: int, data: bytes):
+        """Write a whole chunk to a raw file descriptor (os.write may write partially)."""
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    
+    def _update_progress(download_info: dict, downloaded: int, total_size: int):
+        """
+        Publish download progress for the polling endpoint.
+        The serialized response body is only rebuilt when the whole percentage changes
+        (or on every update when the total size is unknown), and only for single
+        downloads - batch children are reported through get_batch_progress.
+        """
+        progress = download_info['progress']
+        percent = int((downloaded / total_size * 100)) if total_size > 0 else 0
+        percent_changed = percent != progress['percent']
+        
+        progress['downloaded'] = downloaded
+        progress['total'] = total_size
+        progress['percent'] = percent
+        
+        if 'progress_bytes' in download_info and (percent_changed or total_size <= 0):
+            download_info['progress_bytes'] = _progress_body(progress)
+    
+    def _progress_body(progress: dict) -> bytes:
+        """Serialize the 'downloading' progress response."""
+        return _dumps({'status': 'downloading', 'progress': progress})
+    
     # Register routes with the app
     try:
         app = PromptServer.instance.app
@@ -321,8 +717,11 @@ def register_api_routes():
         app.router.add_get('/model_linker/health', health_check)
         app.router.add_post('/model_linker/cache/refresh', refresh_cache)
         app.router.add_post('/model_linker/download', download_model)
+        app.router.add_post('/model_linker/download/batch', download_batch)
+        app.router.add_get('/model_linker/download/batch/{batch_id}/progress', get_batch_progress)
         app.router.add_get('/model_linker/download/{download_id}/progress', get_download_progress)
-        app.router.add_post('/model_linker/download/{id}/cancel', cancel_download)
+        app.router.add_post('/model_linker/download/{download_id}/cancel', cancel_download)
+        app.on_shutdown.append(_close_session)
         
         _routes_registered = True
         logger.info("✓ Model Linker: API routes registered successfully!")
@@ -337,23 +736,21 @@ def delayed_registration():
     """
     Background thread that waits for PromptServer to be ready,
     then registers routes. This handles the timing issue in ComfyUI Desktop.
-    """
-    max_attempts = 30  # Try for up to 30 seconds
-    attempt = 0
     
-    while attempt < max_attempts and not _routes_registered:
-        attempt += 1
-        time.sleep(1)
+    Routes have to be added before the server starts (aiohttp freezes the router
+    then), so this can't wait for the event loop to run - hence a thread.
+    """
+    for attempt in range(1, REGISTRATION_MAX_ATTEMPTS + 1):
+        time.sleep(REGISTRATION_RETRY_INTERVAL)
         
         if register_api_routes():
             logger.info(f"Model Linker: Routes registered on attempt {attempt}")
             return
         
-        if attempt % 5 == 0:
-            logger.debug(f"Model Linker: Waiting for server... (attempt {attempt}/{max_attempts})")
+        if attempt % 10 == 0:
+            logger.debug(f"Model Linker: Waiting for server... (attempt {attempt}/{REGISTRATION_MAX_ATTEMPTS})")
     
-    if not _routes_registered:
-        logger.warning("Model Linker: Could not register routes after maximum attempts")
+    logger.warning("Model Linker: Could not register routes after maximum attempts")
 
 
 # Try immediate registration first
@@ -6,17 +6,63 @@ Allows Model Linker to find models even across drives and after restarts.
 """
 
 import os
-import json
+import mmap
 import logging
 import time
-from typing import List, Dict, Optional
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Iterable, Iterator
+from collections.abc import Mapping
 from pathlib import Path
 
+# orjson does encode/decode in C - fall back to stdlib json if it's not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
+# ijson lets us stream the models array instead of parsing the whole file at once
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Model Linker install directory (parent of core/)
+_HERE = Path(__file__).resolve().parent
+_LINKER_DIR = _HERE.parent
+
+# Max threads used to overlap existence checks on cached model paths
+EXISTS_CHECK_WORKERS = 16
+
+
+def _dumps(data: Dict) -> bytes:
+    """Serialize cache data to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_default(obj):
+    """Serialize mapping records (scanner.ModelRec) as plain JSON objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data) -> Dict:
+    """Parse JSON from a bytes-like object."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data).decode('utf-8'))
+
+
+@functools.lru_cache(maxsize=1)
 def get_cache_path() -> Path:
     """
     Get the path to the cache file.
     Uses ComfyUI's user directory if available, otherwise falls back to config directory.
+    The result is memoized - it doesn't change while ComfyUI is running.
     """
     try:
         import folder_paths
@@ -40,7 +86,7 @@ def get_cache_path() -> Path:
         pass
     
     # Last resort: use the Model Linker directory
-    cache_file = Path(__file__).parent.parent / "model_linker_cache.json"
+    cache_file = _LINKER_DIR / "model_linker_cache.json"
     return cache_file
 
 
@@ -66,9 +112,12 @@ def load_cache() -> Dict:
         }
     
     try:
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
-            
+        # Map the file and parse straight from the mapped bytes (no str decode pass)
+        with open(cache_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    cache_data = _loads(view)
+        
         # Validate cache structure
         if not isinstance(cache_data, dict):
             return {'models': [], 'last_updated': 0, 'version': 1}
@@ -117,12 +166,27 @@ def save_cache(models: List[Dict], metadata: Optional[Dict] = None) -> bool:
     
     try:
         # Write to temporary file first, then rename (atomic write)
+        # fsync before the rename so a crash can't leave an empty/partial cache behind
         temp_path = cache_path.with_suffix('.tmp')
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        data = memoryview(_dumps(cache_data))
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         
         # Atomic rename
-        temp_path.replace(cache_path)
+        os.replace(temp_path, cache_path)
+        
+        # Persist the rename itself (directories can't be opened/fsynced on Windows)
+        if os.name == 'posix':
+            dir_fd = os.open(cache_path.parent, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
         
         logging.info(f"Model Linker: Saved cache with {len(models)} models to {cache_path}")
         return True
@@ -132,6 +196,75 @@ def save_cache(models: List[Dict], metadata: Optional[Dict] = None) -> bool:
         return False
 
 
+def load_cache_metadata() -> Dict:
+    """
+    Load only the cache header fields (everything except 'models').
+    
+    With ijson available the models array is skipped while parsing, so no
+    model dicts are allocated.
+    
+    Returns:
+        Dictionary with 'last_updated', 'version' and any other header fields
+    """
+    if ijson is None:
+        cache_data = load_cache()
+        cache_data.pop('models', None)
+        return cache_data
+    
+    cache_path = get_cache_path()
+    metadata = {'last_updated': 0, 'version': 1}
+    
+    if not cache_path.exists():
+        return metadata
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            key = None
+            builder = None
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix == '':
+                    # Top-level object boundary or key - finish the previous field
+                    if builder is not None:
+                        metadata[key] = builder.value
+                        builder = None
+                    if event == 'map_key':
+                        key = value
+                        if key != 'models':
+                            builder = ijson.ObjectBuilder()
+                elif builder is not None:
+                    builder.event(event, value)
+    except Exception as e:
+        logging.warning(f"Model Linker: Failed to load cache metadata: {e}")
+        return {'last_updated': 0, 'version': 1}
+    
+    return metadata
+
+
+def iter_cached_models() -> Iterator[Dict]:
+    """
+    Iterate over cached models one at a time.
+    
+    Streams the models array with ijson when available so only one model dict
+    is alive at a time; otherwise falls back to load_cache().
+    
+    Yields:
+        Cached model dictionaries
+    """
+    if ijson is None:
+        yield from load_cache().get('models', [])
+        return
+    
+    cache_path = get_cache_path()
+    if not cache_path.exists():
+        return
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            yield from ijson.items(f, 'models.item', use_float=True)
+    except Exception as e:
+        logging.warning(f"Model Linker: Failed to stream cached models: {e}")
+
+
 def should_refresh_cache(config: Dict) -> bool:
     """
     Check if cache should be refreshed based on config settings.
@@ -150,7 +283,7 @@ def should_refresh_cache(config: Dict) -> bool:
     if not cache_config.get('auto_refresh', True):
         return False
     
-    cache_data = load_cache()
+    cache_data = load_cache_metadata()
     last_updated = cache_data.get('last_updated', 0)
     
     if last_updated == 0:
@@ -174,11 +307,10 @@ def get_cached_models() -> List[Dict]:
     Returns:
         List of cached model dictionaries
     """
-    cache_data = load_cache()
-    return cache_data.get('models', [])
+    return list(iter_cached_models())
 
 
-def merge_models_with_cache(scanned_models: List[Dict], cached_models: List[Dict]) -> List[Dict]:
+def merge_models_with_cache(scanned_models: List[Dict], cached_models: Iterable[Dict]) -> List[Dict]:
     """
     Merge newly scanned models with cached models.
     Prioritizes scanned models (they're current), but includes cached models
@@ -186,25 +318,46 @@ def merge_models_with_cache(scanned_models: List[Dict], cached_models: List[Dict
     
     Args:
         scanned_models: Models found in current scan
-        cached_models: Models from cache
+        cached_models: Models from cache (any iterable, e.g. iter_cached_models())
         
     Returns:
         Merged list of models (deduplicated by absolute path)
     """
     # Create a set of scanned model paths for quick lookup
-    scanned_paths = {os.path.abspath(m.get('path', '')) for m in scanned_models if m.get('path')}
+    # Paths from the scanner are already absolute, so only normalize them (no syscalls)
+    seen_paths = {_normalize_path(m['path']) for m in scanned_models if m.get('path')}
     
     # Start with scanned models (they're current)
     merged = scanned_models.copy()
     
-    # Add cached models that weren't found in scan (might be on other drives)
+    # Collect cached models that weren't found in scan (might be on other drives)
+    candidates = []
     for cached_model in cached_models:
-        cached_path = os.path.abspath(cached_model.get('path', ''))
-        if cached_path and cached_path not in scanned_paths:
-            # Verify the cached model still exists
-            if os.path.exists(cached_path):
-                merged.append(cached_model)
-                logging.debug(f"Model Linker: Added cached model from other location: {cached_path}")
+        cached_path = cached_model.get('path')
+        if not cached_path:
+            continue
+        key = _normalize_path(cached_path)
+        if key not in seen_paths:
+            seen_paths.add(key)
+            candidates.append(cached_model)
+    
+    if not candidates:
+        return merged
+    
+    # Verify the cached models still exist - stat calls run in parallel since
+    # they may hit slow or network drives
+    workers = min(EXISTS_CHECK_WORKERS, len(candidates))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        still_exists = list(executor.map(os.path.exists, (m['path'] for m in candidates)))
+    
+    for cached_model, exists in zip(candidates, still_exists):
+        if exists:
+            merged.append(cached_model)
+            logging.debug(f"Model Linker: Added cached model from other location: {cached_model['path']}")
     
     return merged
 
+
+def _normalize_path(path: str) -> str:
+    """Normalize a path for comparison (pure string operation, no filesystem access)."""
+    return os.path.normcase(os.path.normpath(path))
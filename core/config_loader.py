@@ -6,11 +6,64 @@ No hardcoded paths - uses ComfyUI's folder_paths to find user directories.
 """
 
 import os
+import copy
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from pathlib import Path
 
+# Model Linker install directory (parent of core/) and user home, computed once
+_HERE = Path(__file__).resolve().parent
+_LINKER_DIR = _HERE.parent
+_HOME = Path(os.path.expanduser("~"))
 
+# Default configuration - user config values are deep-merged on top
+_DEFAULT_CONFIG = {
+    'additional_directories': [],
+    'cache': {
+        'enabled': True,
+        'filename': 'model_linker_cache.json',
+        'auto_refresh': True,
+        'refresh_interval_hours': 0
+    },
+    'scanning': {
+        'max_depth': 0,
+        'follow_symlinks': True,
+        'skip_hidden': True,
+        'workers': 16
+    }
+}
+
+# Max threads used to check additional directories (which may be on network drives)
+DIRECTORY_CHECK_WORKERS = 16
+
+
+def _cache_found(func):
+    """
+    Memoize a no-argument path lookup once it finds something.
+    
+    None isn't cached, so a file created after startup is still found by a later
+    call. Like lru_cache, the wrapper has a cache_clear() method.
+    """
+    found = None
+    
+    @functools.wraps(func)
+    def wrapper():
+        nonlocal found
+        if found is None:
+            found = func()
+        return found
+    
+    def cache_clear():
+        nonlocal found
+        found = None
+    
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+@_cache_found
 def find_config_file() -> Optional[Path]:
     """
     Find the Model Linker config file in order of priority:
@@ -33,16 +86,13 @@ def find_config_file() -> Optional[Path]:
             # Fallback: try to construct user directory
             base_path = folder_paths.base_path
             if base_path:
-                # Common patterns
-                possible_user_dirs = [
+                # Common patterns (only probe until the first one exists)
+                possible_user_dirs = (
                     Path(base_path) / "user",
                     Path(base_path).parent / "user",
-                    Path(os.path.expanduser("~")) / "AppData" / "Roaming" / "ComfyUI",
-                ]
-                for pd in possible_user_dirs:
-                    if pd.exists():
-                        user_dir = str(pd)
-                        break
+                    _HOME / "AppData" / "Roaming" / "ComfyUI",
+                )
+                user_dir = next((pd for pd in possible_user_dirs if pd.exists()), None)
     except:
         pass
     
@@ -54,20 +104,20 @@ def find_config_file() -> Optional[Path]:
             return user_config
     
     # Priority 2: Model Linker directory
-    linker_dir = Path(__file__).parent.parent
-    linker_config = linker_dir / config_name
+    linker_config = _LINKER_DIR / config_name
     if linker_config.exists():
         logging.info(f"Model Linker: Found config at {linker_config}")
         return linker_config
     
     # Priority 3: Example file (for reference, but won't be used)
-    example_config = linker_dir / f"{config_name}.example"
+    example_config = _LINKER_DIR / f"{config_name}.example"
     if example_config.exists():
         logging.debug(f"Model Linker: Found example config at {example_config} (not used)")
     
     return None
 
 
+@_cache_found
 def find_extra_models_config() -> Optional[Path]:
     """
     Find ComfyUI's extra_models_config.yaml dynamically.
@@ -92,9 +142,9 @@ def find_extra_models_config() -> Optional[Path]:
             base_path = folder_paths.base_path
             if base_path:
                 possible_paths = [
-                    Path(os.path.expanduser("~")) / "AppData" / "Roaming" / "ComfyUI" / "extra_models_config.yaml",
+                    _HOME / "AppData" / "Roaming" / "ComfyUI" / "extra_models_config.yaml",
                     Path(base_path).parent / "extra_models_config.yaml",
-                    Path(os.path.expanduser("~")) / ".config" / "ComfyUI" / "extra_models_config.yaml",
+                    _HOME / ".config" / "ComfyUI" / "extra_models_config.yaml",
                 ]
                 for path in possible_paths:
                     if path.exists():
@@ -108,45 +158,41 @@ def find_extra_models_config() -> Optional[Path]:
 def load_config() -> Dict:
     """
     Load Model Linker configuration file.
+    The parsed file is cached and only re-read when its modification time changes;
+    each caller gets its own copy, so modifying it doesn't affect later calls.
     
     Returns:
         Configuration dictionary with defaults applied
     """
     config_path = find_config_file()
     
-    defaults = {
-        'additional_directories': [],
-        'cache': {
-            'enabled': True,
-            'filename': 'model_linker_cache.json',
-            'auto_refresh': True,
-            'refresh_interval_hours': 0
-        },
-        'scanning': {
-            'max_depth': 0,
-            'follow_symlinks': True,
-            'skip_hidden': True
-        }
-    }
+    try:
+        mtime = config_path.stat().st_mtime_ns if config_path else None
+    except OSError:
+        mtime = None
+    
+    return copy.deepcopy(_load_config_file(config_path, mtime))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_file(config_path: Optional[Path], mtime: Optional[int]) -> Dict:
+    """Parse and merge the config file (cached by path and mtime - see load_config)."""
+    # Merge into a copy so the result never shares lists or sections with _DEFAULT_CONFIG
+    defaults = copy.deepcopy(_DEFAULT_CONFIG)
     
-    if not config_path or not config_path.exists():
+    if mtime is None:
         logging.debug("Model Linker: No config file found, using defaults")
         return defaults
     
     try:
         import yaml
+        # Use the libyaml C loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         with open(config_path, 'r', encoding='utf-8') as f:
-            user_config = yaml.safe_load(f) or {}
+            user_config = yaml.load(f, Loader=loader) or {}
         
-        # Merge with defaults
-        config = defaults.copy()
-        config.update(user_config)
-        
-        # Deep merge nested dicts
-        if 'cache' in user_config:
-            config['cache'].update(user_config['cache'])
-        if 'scanning' in user_config:
-            config['scanning'].update(user_config['scanning'])
+        # Deep merge with defaults (user_config was just parsed, so nothing else holds it)
+        config = _deep_merge(defaults, user_config)
         
         logging.info(f"Model Linker: Loaded config from {config_path}")
         return config
@@ -159,6 +205,20 @@ def load_config() -> Dict:
         return defaults
 
 
+def _deep_merge(base: Dict, override: Dict) -> Dict:
+    """
+    Merge override into base, recursing into nested dicts. Returns a new dict, but
+    values are not copied - pass copies of anything the result mustn't share.
+    Non-dict overrides of a nested section are ignored.
+    """
+    merged = {**base, **override}
+    for key, value in base.items():
+        if isinstance(value, dict):
+            section = override.get(key)
+            merged[key] = _deep_merge(value, section if isinstance(section, dict) else {})
+    return merged
+
+
 def get_additional_directories(config: Dict) -> List[str]:
     """
     Get list of additional directories to scan from config.
@@ -178,7 +238,7 @@ def get_additional_directories(config: Dict) -> List[str]:
     config_path = find_config_file()
     base_dir = config_path.parent if config_path else Path.cwd()
     
-    resolved_paths = []
+    candidates = []
     for path_str in additional:
         if not path_str or not isinstance(path_str, str):
             continue
@@ -188,9 +248,19 @@ def get_additional_directories(config: Dict) -> List[str]:
         if not path.is_absolute():
             # Relative to config file directory
             path = base_dir / path
-        
-        abs_path = path.resolve()
-        if abs_path.exists() and abs_path.is_dir():
+        candidates.append((path_str, path))
+    
+    if not candidates:
+        return []
+    
+    # Check all directories in parallel - these may be slow network/SMB mounts
+    workers = min(DIRECTORY_CHECK_WORKERS, len(candidates))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        checked = list(executor.map(_resolve_directory, (path for _, path in candidates)))
+    
+    resolved_paths = []
+    for (path_str, _), abs_path in zip(candidates, checked):
+        if abs_path is not None:
             resolved_paths.append(str(abs_path))
             logging.debug(f"Model Linker: Added additional directory: {abs_path}")
         else:
@@ -198,3 +268,21 @@ def get_additional_directories(config: Dict) -> List[str]:
     
     return resolved_paths
 
+
+def _resolve_directory(path: Path) -> Optional[Path]:
+    """Resolve a path, returning it only if it is an existing directory."""
+    try:
+        abs_path = path.resolve(strict=False)
+        return abs_path if abs_path.is_dir() else None
+    except OSError:
+        return None
+
+
+def invalidate_path_caches():
+    """Clear memoized config/cache path lookups (called by scanner.clear_model_cache)."""
+    from .cache import get_cache_path
+    
+    get_cache_path.cache_clear()
+    find_config_file.cache_clear()
+    find_extra_models_config.cache_clear()
+    _load_config_file.cache_clear()
@@ -0,0 +1,13 @@
+"""
+Shared Constants
+
+Model file extensions and folder_paths category names used by the scanner
+and the workflow analyzer.
+"""
+
+# Model file extensions to look for
+# This matches folder_paths.supported_pt_extensions
+MODEL_EXTENSIONS = frozenset({'.ckpt', '.pt', '.pt2', '.bin', '.pth', '.safetensors', '.pkl', '.sft', '.onnx'})
+
+# folder_paths categories that don't hold models
+SKIP_CATEGORIES = frozenset({'custom_nodes', 'configs'})
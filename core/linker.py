@@ -10,7 +10,7 @@ from typing import Dict, Any, List, Optional
 
 from .scanner import get_model_files
 from .workflow_analyzer import analyze_workflow_models, identify_missing_models
-from .matcher import find_matches
+from .matcher import find_matches, build_index
 from .workflow_updater import update_workflow_nodes
 
 
@@ -58,6 +58,7 @@ def analyze_and_find_matches(
     
     # Get available models
     available_models = get_model_files()
+    build_index(available_models)
     
     # Identify missing models
     missing_models = identify_missing_models(all_model_refs, available_models)
@@ -152,6 +153,31 @@ def apply_resolution(
     Returns:
         Updated workflow JSON dictionary
     """
+    return update_workflow_nodes(workflow_json, _build_mappings(resolutions))
+
+
+def apply_resolution_patch(
+    workflow_json: Dict[str, Any],
+    resolutions: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Apply model resolutions and return only what changed, as a JSON Patch.
+    
+    Args:
+        workflow_json: Workflow JSON dictionary (will be modified)
+        resolutions: List of resolution dictionaries (same format as apply_resolution)
+        
+    Returns:
+        List of RFC 6902 'replace' operations, e.g.
+        {'op': 'replace', 'path': '/nodes/3/widgets_values/0', 'value': 'model.safetensors'}
+    """
+    patch = []
+    update_workflow_nodes(workflow_json, _build_mappings(resolutions), patch)
+    return patch
+
+
+def _build_mappings(resolutions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert resolution dictionaries into workflow_updater mappings."""
     # Prepare mappings for workflow_updater
     mappings = []
     for resolution in resolutions:
@@ -175,10 +201,7 @@ def apply_resolution(
         
         mappings.append(mapping)
     
-    # Update workflow
-    updated_workflow = update_workflow_nodes(workflow_json, mappings)
-    
-    return updated_workflow
+    return mappings
 
 
 def get_resolution_summary(workflow_json: Dict[str, Any]) -> Dict[str, Any]:
@@ -7,8 +7,146 @@ Uses intelligent token-based matching with version number awareness.
 
 import os
 import re
-from typing import List, Dict, Tuple, Set
-from difflib import SequenceMatcher
+import heapq
+from typing import List, Dict, Tuple, Set, Sequence
+
+# rapidfuzz computes the Indel ratio in C++ - fall back to the same ratio in pure Python
+# (_indel_similarity) if it's not installed, so scores never depend on the install
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
+# numpy backs rapidfuzz's cdist batch scoring below
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# process.cdist scores a whole candidate list in one call (across all cores)
+try:
+    from rapidfuzz import process as rf_process
+except ImportError:
+    rf_process = None
+
+# Separator patterns used by normalize_filename / tokenize_model_name
+_SEP_RE = re.compile(r'[_\-\s]+')
+_TOKEN_RE = re.compile(r'[_\-\.\s]+')
+
+# Trailing tokens tokenize_model_name drops as file extensions
+_EXTENSION_TOKENS = frozenset(('safetensors', 'pt', 'ckpt', 'bin', 'pth'))
+
+# Memoized normalize_filename / tokenize_model_name results, keyed by filename (see clear_caches)
+_NORM_CACHE: Dict[str, str] = {}
+_TOK_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+# int.bit_count() is Python 3.10+
+_popcount = getattr(int, 'bit_count', None) or (lambda n: bin(n).count('1'))
+
+# Per-filename unique token set, for calculate_batch_token_similarity
+_TOKEN_SET_CACHE: Dict[str, frozenset] = {}
+
+# Weight of token vs character similarity in calculate_similarity_with_normalization
+TOKEN_WEIGHT = 0.7
+CHAR_WEIGHT = 0.3
+
+# Max bonus calculate_token_similarity adds for tokens matching in order
+ORDER_BONUS = 0.2
+
+# Inverted token index over the scanned model list (see build_index)
+_index_models = None  # The indexed list - kept referenced so candidate id()s stay unique
+_index_ids: Set[int] = set()  # id() of every indexed candidate
+_postings: Dict[str, Set[int]] = {}  # token -> id() of candidates containing it
+_untokenized_ids: Set[int] = set()  # Candidates with no tokens (only reachable by exact match)
+_exact_index: Dict[str, Set[int]] = {}  # normalize_filename(filename) -> id() of candidates
+
+
+def clear_caches():
+    """Clear memoized filename normalization/tokenization (call when the model list is rescanned)."""
+    _NORM_CACHE.clear()
+    _TOK_CACHE.clear()
+    _TOKEN_SET_CACHE.clear()
+    _clear_index()
+
+
+def _clear_index():
+    """Drop the inverted token index."""
+    global _index_models
+    _index_models = None
+    _index_ids.clear()
+    _postings.clear()
+    _untokenized_ids.clear()
+    _exact_index.clear()
+
+
+def _basename(path: str) -> str:
+    """os.path.basename via str.rpartition (also splits on os.altsep, like ntpath)."""
+    if os.altsep:
+        path = path.rpartition(os.altsep)[2]
+    return path.rpartition(os.sep)[2]
+
+
+def _strip_ext(filename: str) -> str:
+    """os.path.splitext(filename)[0] via str.rfind (a leading dot doesn't start an extension)."""
+    dot = filename.rfind('.')
+    return filename[:dot] if dot > 0 else filename
+
+
+def _candidate_filename(candidate: Dict[str, str]) -> str:
+    """Get a candidate's filename (prefer 'filename' key, fallback to 'path' or 'relative_path')."""
+    candidate_filename = candidate.get('filename')
+    
+    # If no filename key, try to extract from path or relative_path
+    if not candidate_filename:
+        candidate_path = candidate.get('path', '') or candidate.get('relative_path', '')
+        if candidate_path:
+            candidate_filename = _basename(candidate_path)
+    
+    return candidate_filename
+
+
+def _match_tokens(filename: str) -> Set[str]:
+    """Tokens of a filename with and without its extension (the two forms find_matches compares)."""
+    return set(_tokenize_cached(filename)) | set(_tokenize_cached(_strip_ext(filename)))
+
+
+def build_index(candidate_models: List[Dict[str, str]]):
+    """
+    Build an inverted token index over a model list for find_matches.
+    
+    With the index in place, find_matches skips candidates that share no token
+    with the target whenever the threshold rules them out anyway. Rebuilding is
+    a no-op when called again with the same list object.
+    
+    Args:
+        candidate_models: Model list (usually the scanner's cached list)
+    """
+    global _index_models
+    
+    if candidate_models is _index_models:
+        return
+    
+    _clear_index()
+    
+    for candidate in candidate_models:
+        candidate_filename = _candidate_filename(candidate)
+        if not candidate_filename:
+            continue
+        
+        # Precompute token sets for both forms find_matches scores
+        _token_set(candidate_filename)
+        _token_set(_strip_ext(candidate_filename))
+        
+        candidate_id = id(candidate)
+        _index_ids.add(candidate_id)
+        _exact_index.setdefault(normalize_filename(candidate_filename), set()).add(candidate_id)
+        tokens = _match_tokens(candidate_filename)
+        if not tokens:
+            _untokenized_ids.add(candidate_id)
+        for token in tokens:
+            _postings.setdefault(token, set()).add(candidate_id)
+    
+    _index_models = candidate_models
 
 
 def normalize_filename(filename: str) -> str:
@@ -24,15 +162,20 @@ def normalize_filename(filename: str) -> str:
     Returns:
         Normalized string for comparison
     """
+    cached = _NORM_CACHE.get(filename)
+    if cached is not None:
+        return cached
+    
     # Convert to lowercase
     base = filename.lower()
     
     # Normalize separators: replace underscores, hyphens, and spaces with a single space
-    base = re.sub(r'[_\-\s]+', ' ', base)
+    base = _SEP_RE.sub(' ', base)
     
     # Strip whitespace
     base = base.strip()
     
+    _NORM_CACHE[filename] = base
     return base
 
 
@@ -47,24 +190,31 @@ def tokenize_model_name(filename: str) -> List[str]:
     Returns:
         List of normalized tokens
     """
-    # Convert to lowercase (don't strip extension - caller handles that)
-    base = filename.lower()
-    
-    # Normalize all separators to single character for consistent splitting
-    # Replace _, -, . with space
-    normalized = re.sub(r'[_\-\.]+', ' ', base)
-    
-    # Split into tokens
-    tokens = normalized.split()
+    return list(_tokenize_cached(filename))
+
+
+def _tokenize_cached(filename: str) -> Tuple[str, ...]:
+    """Memoized tokenize_model_name, returning a shared tuple."""
+    cached = _TOK_CACHE.get(filename)
+    if cached is not None:
+        return cached
+    
+    # Lowercase and split on separators (_, -, . and whitespace) in one regex pass
+    # (don't strip extension by position - version numbers like "wan2.1" look like one)
+    tokens = _TOKEN_RE.split(filename.lower())
+    if tokens and not tokens[-1]:
+        tokens.pop()  # Trailing separator
     
     # Remove common extensions if present (safetensors, pt, ckpt, etc)
-    if tokens and tokens[-1] in ['safetensors', 'pt', 'ckpt', 'bin', 'pth']:
-        tokens = tokens[:-1]
+    if tokens and tokens[-1] in _EXTENSION_TOKENS:
+        tokens.pop()
     
-    return [t for t in tokens if t]  # Remove empty strings
+    tokens = tuple(t for t in tokens if t)  # Remove empty strings
+    _TOK_CACHE[filename] = tokens
+    return tokens
 
 
-def calculate_token_similarity(tokens1: List[str], tokens2: List[str]) -> float:
+def calculate_token_similarity(tokens1: Sequence[str], tokens2: Sequence[str]) -> float:
     """
     Calculate similarity based on token overlap and order.
     Heavily weights exact token matches and version numbers.
@@ -76,21 +226,26 @@ def calculate_token_similarity(tokens1: List[str], tokens2: List[str]) -> float:
     Returns:
         Similarity score from 0.0 to 1.0
     """
+    return _token_similarity(tokens1, frozenset(tokens1), tokens2, frozenset(tokens2))
+
+
+def _token_set(filename: str) -> frozenset:
+    """Memoized set of a filename's tokens."""
+    token_set = _TOKEN_SET_CACHE.get(filename)
+    if token_set is None:
+        token_set = _TOKEN_SET_CACHE[filename] = frozenset(_tokenize_cached(filename))
+    return token_set
+
+
+def _token_similarity(tokens1: Sequence[str], set1: frozenset, tokens2: Sequence[str], set2: frozenset) -> float:
+    """calculate_token_similarity with the unique token sets already built."""
     if not tokens1 or not tokens2:
         return 0.0
     
-    # Convert to sets for intersection
-    set1 = set(tokens1)
-    set2 = set(tokens2)
-    
     # Calculate Jaccard similarity (intersection over union)
-    intersection = set1 & set2
-    union = set1 | set2
-    
-    if not union:
-        return 0.0
-    
-    jaccard = len(intersection) / len(union)
+    # len(A | B) == len(A) + len(B) - len(A & B), so only the intersection set is built
+    intersection = len(set1 & set2)
+    jaccard = intersection / (len(set1) + len(set2) - intersection)
     
     # Bonus for preserving order of key tokens
     order_score = 0.0
@@ -98,17 +253,41 @@ def calculate_token_similarity(tokens1: List[str], tokens2: List[str]) -> float:
         # Check if first few tokens match in order
         max_check = min(3, len(tokens1), len(tokens2))
         matching_order = sum(1 for i in range(max_check) if tokens1[i] == tokens2[i])
-        order_score = matching_order / max_check * 0.2  # Up to 20% bonus
+        order_score = matching_order / max_check * ORDER_BONUS  # Up to 20% bonus
     
     # Combine scores
     return min(jaccard + order_score, 1.0)
 
 
+def calculate_batch_token_similarity(target: str, choices: List[str]) -> List[float]:
+    """
+    Calculate calculate_token_similarity of target's tokens against every choice's tokens.
+    
+    Token lists and sets come from the per-filename caches build_index warms,
+    so no candidate is re-tokenized.
+    
+    Args:
+        target: Target filename
+        choices: Candidate filenames
+        
+    Returns:
+        List of token similarity scores (0.0 to 1.0), in the same order as choices
+    """
+    if not choices:
+        return []
+    
+    target_tokens = _tokenize_cached(target)
+    target_set = _token_set(target)
+    return [_token_similarity(target_tokens, target_set, _tokenize_cached(choice), _token_set(choice))
+            for choice in choices]
+
+
 def calculate_similarity(str1: str, str2: str) -> float:
     """
     Calculate similarity score between two strings (0.0 to 1.0).
     
-    Uses SequenceMatcher to compute a ratio.
+    Uses the normalized Indel similarity (rapidfuzz's when available, otherwise
+    the identical pure-Python _indel_similarity).
     
     Args:
         str1: First string
@@ -117,10 +296,88 @@ def calculate_similarity(str1: str, str2: str) -> float:
     Returns:
         Similarity score from 0.0 (completely different) to 1.0 (identical)
     """
-    return SequenceMatcher(None, str1, str2).ratio()
+    if Indel is not None:
+        return Indel.normalized_similarity(str1, str2)
+    return _indel_similarity(_lcs_masks(str1), len(str1), str2)
+
+
+def _lcs_masks(text: str) -> Dict[str, int]:
+    """Bit masks of the positions of each character in text, for _indel_similarity."""
+    masks = {}
+    bit = 1
+    for ch in text:
+        masks[ch] = masks.get(ch, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _indel_similarity(masks1: Dict[str, int], len1: int, str2: str) -> float:
+    """
+    rapidfuzz's Indel.normalized_similarity in pure Python, for when it isn't installed.
+    
+    The longest common subsequence comes from the same bit-parallel algorithm rapidfuzz
+    uses, with a Python int as a len1-bit vector - a few int operations per character
+    of str2 instead of an O(n*m) table.
+    
+    Args:
+        masks1: _lcs_masks() of the first string
+        len1: Length of the first string
+        str2: Second string
+        
+    Returns:
+        1 - (len1 + len2 - 2 * LCS) / (len1 + len2), 1.0 for two empty strings
+    """
+    total = len1 + len(str2)
+    if not total:
+        return 1.0
+    
+    full = (1 << len1) - 1
+    s = full
+    for ch in str2:
+        m = masks1.get(ch)
+        if m:
+            u = s & m
+            s = ((s + u) | (s - u)) & full
+    lcs = len1 - _popcount(s)
+    return 1.0 - (total - 2 * lcs) / total
+
+
+def calculate_batch_similarity(query: str, choices: List[str]) -> List[float]:
+    """
+    Calculate the character similarity of query against every choice in one pass.
+    
+    Same score as calculate_similarity. Uses rapidfuzz's process.cdist when available,
+    rapidfuzz pair by pair without numpy, and _indel_similarity when rapidfuzz isn't
+    installed (the query's bit masks are built once for all choices).
+    
+    Args:
+        query: String to compare against every choice
+        choices: Strings to score
+        
+    Returns:
+        List of similarity scores (0.0 to 1.0), in the same order as choices
+    """
+    if not choices:
+        return []
+    
+    if rf_process is not None and np is not None:
+        scores = rf_process.cdist([query], choices, scorer=Indel.normalized_similarity,
+                                  dtype=np.float64, workers=-1)
+        return scores[0].tolist()
+    
+    if Indel is not None:
+        return [Indel.normalized_similarity(query, choice) for choice in choices]
+    
+    masks = _lcs_masks(query)
+    return [_indel_similarity(masks, len(query), choice) for choice in choices]
 
 
-def calculate_similarity_with_normalization(str1: str, str2: str) -> float:
+def calculate_similarity_with_normalization(
+    str1: str,
+    str2: str,
+    char_sim: float = None,
+    token_sim: float = None
+) -> float:
     """
     Calculate similarity score with intelligent token-based matching.
     
@@ -129,6 +386,8 @@ def calculate_similarity_with_normalization(str1: str, str2: str) -> float:
     Args:
         str1: First string (typically target model filename)
         str2: Second string (typically candidate model filename)
+        char_sim: Precomputed calculate_similarity() of the normalized strings (optional)
+        token_sim: Precomputed calculate_token_similarity() of the tokens (optional)
         
     Returns:
         Similarity score from 0.0 to 1.0
@@ -140,23 +399,60 @@ def calculate_similarity_with_normalization(str1: str, str2: str) -> float:
     if norm1 == norm2:
         return 1.0
     
-    # Tokenize both filenames
-    tokens1 = tokenize_model_name(str1)
-    tokens2 = tokenize_model_name(str2)
-    
     # Calculate token-based similarity
-    token_sim = calculate_token_similarity(tokens1, tokens2)
+    if token_sim is None:
+        token_sim = calculate_token_similarity(_tokenize_cached(str1), _tokenize_cached(str2))
     
     # Also calculate character-based similarity as a backup
-    char_sim = calculate_similarity(norm1, norm2)
+    if char_sim is None:
+        char_sim = calculate_similarity(norm1, norm2)
     
     # Weight token similarity more heavily (70/30 split)
     # Token matching is better for semantic similarity
-    final_sim = (token_sim * 0.7) + (char_sim * 0.3)
+    final_sim = (token_sim * TOKEN_WEIGHT) + (char_sim * CHAR_WEIGHT)
     
     return final_sim
 
 
+def _size_ratio(size1: int, size2: int) -> float:
+    """Upper bound on the jaccard of two sets with these sizes."""
+    larger = max(size1, size2)
+    return min(size1, size2) / larger if larger else 1.0
+
+
+def _find_exact_matches(
+    target_norm: str,
+    candidate_models: List[Dict[str, str]],
+    max_results: int
+) -> List[Dict[str, any]]:
+    """Collect up to max_results candidates whose normalized filename equals target_norm, in candidate order."""
+    hit_ids = _exact_index[target_norm]
+    matches = []
+    for candidate in candidate_models:
+        if len(matches) >= max_results:
+            break
+        
+        candidate_id = id(candidate)
+        if candidate_id in _index_ids:
+            if candidate_id not in hit_ids:
+                continue
+            candidate_filename = _candidate_filename(candidate)
+        else:
+            # Not indexed - check it directly
+            candidate_filename = _candidate_filename(candidate)
+            if not candidate_filename or normalize_filename(candidate_filename) != target_norm:
+                continue
+        
+        matches.append({
+            'model': candidate,
+            'filename': candidate_filename,
+            'similarity': 1.0,
+            'confidence': 100.0
+        })
+    
+    return matches
+
+
 def find_matches(
     target_model: str,
     candidate_models: List[Dict[str, str]],
@@ -181,28 +477,84 @@ def find_matches(
             'confidence': confidence percentage (0 to 100)
         }
     """
-    matches = []
-    
     # Extract just the filename from target_model (remove any subfolder paths)
     # target_model might be just a filename or might include subfolder paths
-    target_filename = os.path.basename(target_model)
+    target_filename = _basename(target_model)
+    target_base = _strip_ext(target_filename)
     
     # Normalize target filename once for exact match comparisons
     target_norm = normalize_filename(target_filename)
     
+    # An exact normalized match outranks everything else - if the index has one, return
+    # the exact matches alone (in candidate order) without scoring the rest
+    if _index_models is not None and target_norm in _exact_index:
+        exact_matches = _find_exact_matches(target_norm, candidate_models, max_results)
+        if exact_matches:
+            return exact_matches
+    
+    # A candidate sharing no token with the target scores at most CHAR_WEIGHT,
+    # so above that threshold the inverted index can rule it out without scoring
+    shortlist = None
+    if threshold > CHAR_WEIGHT and _index_models is not None:
+        shortlist = set(_untokenized_ids)
+        for token in _match_tokens(target_filename):
+            shortlist |= _postings.get(token, set())
+    
+    # Size bound: the score is at most TOKEN_WEIGHT * (jaccard + ORDER_BONUS) + CHAR_WEIGHT and the
+    # jaccard of token sets sized a and b is at most min(a, b) / max(a, b), so candidates whose
+    # token count is too far from the target's can't reach the threshold
+    min_size_ratio = (threshold - CHAR_WEIGHT) / TOKEN_WEIGHT - ORDER_BONUS - 1e-9
+    if min_size_ratio > 0:
+        target_size = len(_token_set(target_filename))
+        target_base_size = len(_token_set(target_base))
+    
+    # Collect candidate filenames first so the character similarity can be scored as one batch
+    entries = []
     for candidate in candidate_models:
-        # Get filename from candidate (prefer 'filename' key, fallback to extracting from 'path' or 'relative_path')
-        candidate_filename = candidate.get('filename')
-        
-        # If no filename key, try to extract from path or relative_path
-        if not candidate_filename:
-            candidate_path = candidate.get('path', '') or candidate.get('relative_path', '')
-            if candidate_path:
-                candidate_filename = os.path.basename(candidate_path)
+        if shortlist is not None:
+            candidate_id = id(candidate)
+            # Candidates outside the index can't be ruled out
+            if candidate_id not in shortlist and candidate_id in _index_ids:
+                continue
         
+        candidate_filename = _candidate_filename(candidate)
         if not candidate_filename:
             continue
         
+        if min_size_ratio > 0:
+            size_ratio = max(
+                _size_ratio(target_size, len(_token_set(candidate_filename))),
+                _size_ratio(target_base_size, len(_token_set(_strip_ext(candidate_filename))))
+            )
+            if size_ratio < min_size_ratio:
+                continue
+        
+        entries.append((candidate, candidate_filename))
+    
+    # Character and token similarity with and without extensions, for every candidate at once
+    filenames = [filename for _, filename in entries]
+    bases = [_strip_ext(filename) for filename in filenames]
+    char_sims = calculate_batch_similarity(
+        target_norm, [normalize_filename(filename) for filename in filenames])
+    char_sims_no_ext = calculate_batch_similarity(
+        normalize_filename(target_base), [normalize_filename(base) for base in bases])
+    token_sims = calculate_batch_token_similarity(target_filename, filenames)
+    
+    # Known extensions are dropped as tokens, so the extension-less form usually tokenizes the
+    # same way and its token similarity is identical - only rescore candidates where it isn't
+    if _tokenize_cached(target_base) == _tokenize_cached(target_filename):
+        rescore = [i for i, (filename, base) in enumerate(zip(filenames, bases))
+                   if _tokenize_cached(base) != _tokenize_cached(filename)]
+    else:
+        rescore = range(len(filenames))
+    token_sims_no_ext = list(token_sims)
+    rescored = calculate_batch_token_similarity(target_base, [bases[i] for i in rescore])
+    for i, token_sim in zip(rescore, rescored):
+        token_sims_no_ext[i] = token_sim
+    
+    scores = []  # Similarity of each candidate that passed the threshold
+    kept = []  # Its index in entries
+    for i, candidate_filename in enumerate(filenames):
         # Calculate similarity comparing just filenames (not paths)
         # This ensures we're comparing apples to apples
         
@@ -214,39 +566,43 @@ def find_matches(
             # Exact match after normalization = 100% confidence
             similarity = 1.0
         else:
-            # Calculate similarity using SequenceMatcher
-            # This gives a ratio between 0.0 and 1.0 based on longest common subsequence
-            similarity = calculate_similarity_with_normalization(target_filename, candidate_filename)
+            # Combine the batched token and character similarities
+            similarity = calculate_similarity_with_normalization(
+                target_filename, candidate_filename, char_sims[i], token_sims[i])
             
             # Also try comparing without extensions for better matching
-            target_base = os.path.splitext(target_filename)[0]
-            candidate_base = os.path.splitext(candidate_filename)[0]
-            similarity_no_ext = calculate_similarity_with_normalization(target_base, candidate_base)
+            similarity_no_ext = calculate_similarity_with_normalization(
+                target_base, bases[i], char_sims_no_ext[i], token_sims_no_ext[i])
             
             # Use the higher of the two similarity scores
             # But ensure we never get 1.0 unless it's an exact normalized match
             similarity = max(similarity, similarity_no_ext)
             
             # Cap similarity at 0.999 for non-exact matches to prevent false 100% scores
-            # SequenceMatcher can sometimes give 1.0 for very similar but not identical strings
+            # The character ratio can sometimes give 1.0 for very similar but not identical strings
             # due to normalization artifacts
             if similarity >= 0.999 and target_norm != candidate_norm:
                 similarity = 0.999
         
-        # Only include if above threshold
+        # Only include if above threshold (as an entry index - dicts are built for the winners only)
         if similarity >= threshold:
-            matches.append({
-                'model': candidate,
-                'filename': candidate_filename,
-                'similarity': similarity,
-                'confidence': round(similarity * 100, 1)  # Convert to percentage
-            })
-    
-    # Sort by similarity (highest first)
-    matches.sort(key=lambda x: x['similarity'], reverse=True)
-    
-    # Limit to max_results
-    matches = matches[:max_results]
+            scores.append(similarity)
+            kept.append(i)
+    
+    # Top max_results by similarity (highest first) - O(n log k) instead of a full sort;
+    # like the stable sort, ties keep candidate order
+    top = heapq.nlargest(max_results, range(len(kept)), key=scores.__getitem__)
+    
+    matches = []
+    for k in top:
+        candidate, candidate_filename = entries[kept[k]]
+        similarity = scores[k]
+        matches.append({
+            'model': candidate,
+            'filename': candidate_filename,
+            'similarity': similarity,
+            'confidence': round(similarity * 100, 1)  # Convert to percentage
+        })
     
     return matches
 
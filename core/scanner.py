@@ -8,7 +8,13 @@ Uses cache system for faster lookups and cross-drive model discovery.
 import os
 import logging
 import time
-from typing import List, Dict, Tuple
+import itertools
+import functools
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Iterable, Iterator, Optional
+
+from .constants import MODEL_EXTENSIONS, SKIP_CATEGORIES
 
 # Import folder_paths lazily - it may not be available until ComfyUI is initialized
 try:
@@ -17,9 +23,110 @@ except ImportError:
     folder_paths = None
     logging.warning("Model Linker: folder_paths not available yet - will retry later")
 
-# Model file extensions to look for
-# This matches folder_paths.supported_pt_extensions
-MODEL_EXTENSIONS = {'.ckpt', '.pt', '.pt2', '.bin', '.pth', '.safetensors', '.pkl', '.sft', '.onnx'}
+# PyYAML is optional - without it only folder_paths' directories are used
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+# Fields of a scanned model record, in the order the API has always returned them
+MODEL_FIELDS = ('filename', 'path', 'relative_path', 'category', 'base_directory')
+_MODEL_FIELD_SET = frozenset(MODEL_FIELDS)
+
+
+class ModelRec(Mapping):
+    """
+    A scanned model file.
+    
+    Stored with __slots__ rather than as a dict to keep large model libraries compact,
+    but it reads like the dict it replaces (rec['path'], rec.get('category'),
+    'base_directory' in rec, == against a dict). Use asdict() for a real dict.
+    """
+    __slots__ = MODEL_FIELDS
+    
+    def __init__(self, filename: str, path: str, relative_path: str, category: str, base_directory: str):
+        self.filename = filename
+        self.path = path
+        self.relative_path = relative_path
+        self.category = category
+        self.base_directory = base_directory
+    
+    def __getitem__(self, key):
+        if key in _MODEL_FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def get(self, key, default=None):
+        return getattr(self, key) if key in _MODEL_FIELD_SET else default
+    
+    def __contains__(self, key) -> bool:
+        return key in _MODEL_FIELD_SET
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(MODEL_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(MODEL_FIELDS)
+    
+    def __repr__(self) -> str:
+        return f"ModelRec({self.asdict()!r})"
+    
+    def asdict(self) -> Dict[str, str]:
+        """Return the record as a plain dict (e.g. for JSON serialization)."""
+        return {
+            'filename': self.filename,
+            'path': self.path,
+            'relative_path': self.relative_path,
+            'category': self.category,
+            'base_directory': self.base_directory
+        }
+
+
+# Directories that never hold models (besides hidden ones) - not walked
+SKIP_DIRS = frozenset({'__pycache__', 'node_modules'})
+
+# Default/max threads used to walk model directories concurrently (config: scanning.workers)
+SCAN_WORKERS = 16
+MAX_SCAN_WORKERS = 32
+
+
+# Memoized get_model_directories() result as (key, directories) - see _directories_key
+_directories_cache = None
+
+# Per-tree scan_directory results: (category, directory, extensions) -> (directory mtimes, models)
+# Reused while no directory in the tree has changed (see invalidate)
+_scan_cache: Dict[Tuple[str, str, frozenset], Tuple[Dict[str, int], List[ModelRec]]] = {}
+
+# Directory listings: path -> (mtime ns, [(filename, full path), ...], [subdirectory path, ...])
+# Lets a partly changed tree re-list only the directories whose mtime moved (see _walk_files)
+_dir_cache: Dict[str, Tuple[int, List[Tuple[str, str]], List[str]]] = {}
+
+
+def invalidate(path: Optional[str] = None):
+    """
+    Drop cached scan results.
+    
+    Args:
+        path: A directory whose contents changed (or a file inside it) - only the cached
+            listings and scan results covering it are dropped. If None, the memoized model
+            directories and all scan results are dropped (forces a full rescan).
+    """
+    global _directories_cache
+    if path is not None:
+        path = os.path.abspath(path)
+        stale = (path, os.path.dirname(path))
+        for directory in stale:
+            _dir_cache.pop(directory, None)
+        for key, (dir_mtimes, _) in list(_scan_cache.items()):
+            if any(directory in dir_mtimes for directory in stale):
+                del _scan_cache[key]
+        return
+    
+    _directories_cache = None
+    _scan_cache.clear()
+    _dir_cache.clear()
+    _load_extra_models_config.cache_clear()
 
 
 def get_model_directories() -> Dict[str, Tuple[List[str], set]]:
@@ -27,10 +134,13 @@ def get_model_directories() -> Dict[str, Tuple[List[str], set]]:
     Get all configured model directories from folder_paths.
     Also checks extra_models_config.yaml for additional paths.
     
+    The result is memoized until folder_paths' registered directories or the
+    extra models config file's mtime change (or invalidate() is called).
+    
     Returns:
         Dictionary mapping category name to (list of paths, set of extensions)
     """
-    global folder_paths
+    global folder_paths, _directories_cache
     
     if folder_paths is None:
         # Try to import again
@@ -41,86 +151,263 @@ def get_model_directories() -> Dict[str, Tuple[List[str], set]]:
             logging.error("Model Linker: folder_paths still not available")
             return {}
     
+    if _directories_cache is not None and _directories_cache[0] == _directories_key():
+        return _directories_cache[1]
+    
+    directories = _build_model_directories()
+    # Key is taken after the build, which merges extra paths into folder_paths' lists
+    _directories_cache = (_directories_key(), directories)
+    return directories
+
+
+def _directories_key() -> tuple:
+    """Snapshot of the inputs to get_model_directories (registered folders + config file mtime)."""
+    from .config_loader import find_extra_models_config
+    config_path = find_extra_models_config()
+    try:
+        config_mtime = os.stat(config_path).st_mtime_ns if config_path else None
+    except OSError:
+        config_mtime = None
+    
+    registered = tuple(
+        (name, tuple(paths), tuple(sorted(extensions)))
+        for name, (paths, extensions) in folder_paths.folder_names_and_paths.items()
+    )
+    return (str(config_path), config_mtime, registered)
+
+
+def _build_model_directories() -> Dict[str, Tuple[List[str], set]]:
+    """Build the get_model_directories() result from folder_paths and extra_models_config.yaml."""
     # Get base directories from folder_paths
     directories = folder_paths.folder_names_and_paths.copy()
     
+    # Relative paths are resolved against the cwd looked up once here, rather than by
+    # os.path.abspath (a getcwd call each) for every path
+    cwd = os.getcwd()
+    
+    # Check if folder_paths has a method to get extra paths
+    if hasattr(folder_paths, 'get_extra_model_paths'):
+        try:
+            extra_paths = folder_paths.get_extra_model_paths()
+            if extra_paths:
+                known_paths = {}
+                for category, paths in extra_paths.items():
+                    # Merge paths, avoiding duplicates (new categories get no extension filter)
+                    is_new = category not in directories
+                    for path in paths:
+                        abs_path = _abspath(path, cwd) if not os.path.isabs(path) else path
+                        if _add_directory(directories, known_paths, category, abs_path) and not is_new:
+                            logging.debug(f"Model Linker: Added extra path from folder_paths: {category} -> {abs_path}")
+            
+            # folder_paths has already parsed the extra models config - no need to read it again
+            return directories
+        except Exception as e:
+            logging.debug(f"Model Linker: Error getting extra paths from folder_paths: {e}")
+    
     # Also check for extra_model_paths.yaml to ensure we get all configured paths
     # This is important for ComfyUI Desktop which uses extra_models_config.yaml
     # ComfyUI's folder_paths should already load these, but we double-check to be sure
-    try:
-        import yaml
-    except ImportError:
+    if yaml is None:
         # PyYAML not available - folder_paths should have already loaded the paths
         # If not, we'll rely on what folder_paths provides
         logging.debug("Model Linker: PyYAML not available, using folder_paths paths only")
         return directories
     
-    import os
-    
     # Use dynamic config loader to find extra_models_config.yaml (no hardcoded paths)
     from .config_loader import find_extra_models_config
-    extra_config_path = find_extra_models_config()
-    config_paths = [str(extra_config_path)] if extra_config_path else []
-    
-    # Also check if folder_paths has a method to get extra paths
-    if hasattr(folder_paths, 'get_extra_model_paths'):
-        try:
-            extra_paths = folder_paths.get_extra_model_paths()
-            if extra_paths:
-                for category, paths in extra_paths.items():
-                    if category in directories:
-                        # Merge paths, avoiding duplicates
-                        existing_paths, extensions = directories[category]
-                        for path in paths:
-                            abs_path = os.path.abspath(path) if not os.path.isabs(path) else path
-                            if abs_path not in existing_paths:
-                                existing_paths.append(abs_path)
-                                logging.debug(f"Model Linker: Added extra path from folder_paths: {category} -> {abs_path}")
-                    else:
-                        # New category
-                        directories[category] = ([os.path.abspath(p) if not os.path.isabs(p) else p for p in paths], set())
-        except Exception as e:
-            logging.debug(f"Model Linker: Error getting extra paths from folder_paths: {e}")
+    config_path = find_extra_models_config()
+    if not config_path:
+        return directories
     
     # Try to load from YAML file directly as backup
-    for config_path in config_paths:
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
-                    if config:
-                        for config_name, config_data in config.items():
-                            if isinstance(config_data, dict) and 'base_path' in config_data:
-                                base_path = os.path.abspath(config_data.get('base_path', ''))
-                                if base_path and os.path.exists(base_path):
-                                    # Process each category in this config
-                                    for category, rel_path in config_data.items():
-                                        if category != 'base_path' and category != 'is_default' and isinstance(rel_path, str):
-                                            # Handle both relative and absolute paths
-                                            if os.path.isabs(rel_path):
-                                                full_path = rel_path
-                                            else:
-                                                full_path = os.path.join(base_path, rel_path)
-                                            
-                                            full_path = os.path.abspath(full_path)
-                                            if os.path.exists(full_path):
-                                                # Add to directories
-                                                if category in directories:
-                                                    existing_paths, extensions = directories[category]
-                                                    if full_path not in existing_paths:
-                                                        existing_paths.append(full_path)
-                                                        logging.info(f"Model Linker: Added path from extra_models_config.yaml: {category} -> {full_path}")
-                                                else:
-                                                    directories[category] = ([full_path], set())
-                                                    logging.info(f"Model Linker: Added new category from extra_models_config.yaml: {category} -> {full_path}")
-            except Exception as e:
-                logging.debug(f"Model Linker: Could not load extra_models_config.yaml from {config_path}: {e}")
-            break  # Only try first existing file
+    try:
+        config = _load_extra_models_config(str(config_path), os.stat(config_path).st_mtime_ns)
+        if not isinstance(config, dict):
+            return directories
+        
+        # Resolve every configured (category, path) pair first, then check and merge them
+        # in one pass - os.path.join keeps absolute paths as they are
+        candidates = []
+        for config_data in config.values():
+            if isinstance(config_data, dict) and 'base_path' in config_data:
+                base_path = _abspath(config_data.get('base_path', ''), cwd)
+                if not os.path.isdir(base_path):
+                    continue
+                for category, rel_path in config_data.items():
+                    if category != 'base_path' and category != 'is_default' and isinstance(rel_path, str):
+                        candidates.append((category, _abspath(os.path.join(base_path, rel_path), cwd)))
+        
+        known_paths = {}
+        for category, full_path in candidates:
+            if not os.path.isdir(full_path):
+                continue
+            is_new = category not in directories
+            if _add_directory(directories, known_paths, category, full_path):
+                if is_new:
+                    logging.info(f"Model Linker: Added new category from extra_models_config.yaml: {category} -> {full_path}")
+                else:
+                    logging.info(f"Model Linker: Added path from extra_models_config.yaml: {category} -> {full_path}")
+    except Exception as e:
+        logging.debug(f"Model Linker: Could not load extra_models_config.yaml from {config_path}: {e}")
     
     return directories
 
 
-def scan_directory(directory: str, extensions: set, category: str) -> List[Dict[str, str]]:
+def _abspath(path: str, cwd: str) -> str:
+    """os.path.abspath with the current working directory passed in."""
+    return os.path.normpath(os.path.join(cwd, path))
+
+
+def _add_directory(directories: Dict[str, Tuple[List[str], set]], known_paths: Dict[str, set],
+                   category: str, path: str) -> bool:
+    """
+    Append a path to a category's directory list unless it is already there.
+    
+    Args:
+        directories: get_model_directories()-style dict being built (new categories get
+            an empty extension set)
+        known_paths: Per-category sets of the paths in directories, filled in lazily, so
+            duplicate checks don't scan the path lists
+        category: Model category name
+        path: Absolute directory path
+        
+    Returns:
+        True if the path was added
+    """
+    if category not in directories:
+        directories[category] = ([path], set())
+        known_paths[category] = {path}
+        return True
+    
+    known = known_paths.get(category)
+    if known is None:
+        known = known_paths[category] = set(directories[category][0])
+    if path in known:
+        return False
+    known.add(path)
+    directories[category][0].append(path)
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _load_extra_models_config(config_path: str, mtime: int) -> Dict:
+    """Parse extra_models_config.yaml (cached by path and mtime - see _build_model_directories)."""
+    # Use the libyaml C loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _walk_files(directory: str, dir_mtimes: Dict[str, int] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Recursively yield the files under a directory, skipping hidden directories and SKIP_DIRS.
+    
+    Uses os.scandir so file/directory checks come from the DirEntry instead of extra
+    stat calls. Like os.walk(followlinks=True), symlinked directories are followed,
+    unreadable directories are skipped, and a directory's files come before its
+    subdirectories' files. A directory whose mtime hasn't changed since it was last
+    listed is served from _dir_cache instead of being listed again.
+    
+    Args:
+        directory: Directory to walk
+        dir_mtimes: Optional dict that receives the mtime (ns) of every directory walked
+        
+    Returns:
+        Iterator of (filename, full path) tuples for non-directory entries
+    """
+    # Explicit stack instead of recursion - subdirectories are pushed in reverse so the
+    # first one is walked next, which keeps os.walk's depth-first order
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        listing = _cached_listing(current)
+        if listing is None:
+            continue
+        
+        mtime, files, subdirs = listing
+        if dir_mtimes is not None:
+            dir_mtimes[current] = mtime
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+def _cached_listing(directory: str) -> Optional[Tuple[int, List[Tuple[str, str]], List[str]]]:
+    """
+    Get a directory's listing, re-listing it only if its mtime changed (see _dir_cache).
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        (mtime ns, [(filename, full path), ...], [subdirectory path, ...]), or None if
+        the directory can't be read
+    """
+    try:
+        # Stat before listing so a change made mid-listing still shows up as a newer mtime
+        mtime = os.stat(directory).st_mtime_ns
+        cached = _dir_cache.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached
+        files, subdirs = _list_directory(directory)
+    except OSError:
+        return None
+    
+    listing = _dir_cache[directory] = (mtime, files, subdirs)
+    return listing
+
+
+def _list_directory(directory: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    List a directory's files and subdirectories (minus hidden ones and SKIP_DIRS).
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Tuple of ([(filename, full path), ...], [subdirectory path, ...])
+    """
+    files = []
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            
+            if is_dir:
+                name = entry.name
+                if name[0] != '.' and name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            else:
+                files.append((entry.name, entry.path))
+    return files, subdirs
+
+
+@functools.lru_cache(maxsize=None)
+def _allowed_extensions(extensions: frozenset) -> Optional[frozenset]:
+    """
+    Get the file extensions scan_directory accepts for a category (computed once per extension set).
+    
+    Args:
+        extensions: The category's extensions from folder_paths
+        
+    Returns:
+        The category's extensions plus MODEL_EXTENSIONS, or None (accept all files)
+        for categories with an empty extension set
+    """
+    return MODEL_EXTENSIONS | extensions if extensions else None
+
+
+def _tree_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    """Check that every directory recorded by _walk_files still has the same mtime."""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def scan_directory(directory: str, extensions: set, category: str) -> List[ModelRec]:
     """
     Recursively scan a single directory for model files.
     
@@ -130,7 +417,7 @@ def scan_directory(directory: str, extensions: set, category: str) -> List[Dict[
         category: Model category name (e.g., 'checkpoints', 'loras')
         
     Returns:
-        List of dictionaries with model information:
+        List of ModelRec records, read like dictionaries with model information:
         {
             'filename': 'model.safetensors',
             'path': 'absolute/path/to/model.safetensors',
@@ -149,46 +436,64 @@ def scan_directory(directory: str, extensions: set, category: str) -> List[Dict[
         # Get absolute path and normalize
         base_directory = os.path.abspath(directory)
         
+        # Adding, removing or renaming a file bumps its directory's mtime, so an unchanged
+        # tree can reuse the previous scan without listing anything
+        extensions = frozenset(extensions)
+        cache_key = (category, base_directory, extensions)
+        cached = _scan_cache.get(cache_key)
+        if cached is not None and _tree_unchanged(cached[0]):
+            return list(cached[1])
+        dir_mtimes = {}
+        
         # Walk through directory recursively
-        for root, dirs, files in os.walk(base_directory, followlinks=True):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for filename in files:
-                # Check if file has a model extension
-                file_ext = os.path.splitext(filename)[1].lower()
-                
-                # For categories with empty extension set, accept all files
-                # Otherwise, check if extension matches
-                if len(extensions) == 0 or file_ext in extensions or file_ext in MODEL_EXTENSIONS:
-                    full_path = os.path.join(root, filename)
-                    
-                    # Calculate relative path from base directory
-                    # IMPORTANT: Use OS-native path separators (backslashes on Windows)
-                    # This matches ComfyUI's recursive_search format for get_filename_list
-                    try:
-                        relative_path = os.path.relpath(full_path, base_directory)
-                        # DO NOT normalize - keep OS-native separators to match ComfyUI
-                        # ComfyUI's get_filename_list uses os.path.relpath which returns
-                        # backslashes on Windows, forward slashes on Unix
-                    except ValueError:
-                        # If paths are on different drives (Windows), use filename only
-                        relative_path = filename
-                    
-                    models.append({
-                        'filename': filename,
-                        'path': full_path,
-                        'relative_path': relative_path,
-                        'category': category,
-                        'base_directory': base_directory
-                    })
+        models = _model_records(_walk_files(base_directory, dir_mtimes), base_directory, extensions, category)
+        
+        _scan_cache[cache_key] = (dir_mtimes, list(models))
     except (OSError, PermissionError) as e:
         logging.warning(f"Error scanning directory {directory}: {e}")
     
     return models
 
 
-def scan_all_directories() -> List[Dict[str, str]]:
+def _model_records(files: Iterable[Tuple[str, str]], base_directory: str,
+                   extensions: frozenset, category: str) -> List[ModelRec]:
+    """
+    Build ModelRec records for the walked files that have an accepted extension.
+    
+    Args:
+        files: (filename, full path) tuples from _walk_files
+        base_directory: Absolute directory the files were walked from
+        extensions: The category's extensions (see _allowed_extensions)
+        category: Model category name
+        
+    Returns:
+        List of ModelRec records
+    """
+    models = []
+    
+    # Length of the "base_directory + separator" prefix of every path below it
+    base_len = len(base_directory) if base_directory.endswith(os.sep) else len(base_directory) + 1
+    
+    allowed = _allowed_extensions(extensions)
+    
+    for filename, full_path in files:
+        # Check if file has a model extension
+        dot = filename.rfind('.')
+        file_ext = filename[dot:].lower() if dot > 0 else ''
+        
+        if allowed is None or file_ext in allowed:
+            # Relative path from base directory - full_path is base_directory + sep + ...,
+            # so slicing off the prefix gives what os.path.relpath would
+            # IMPORTANT: Keep OS-native path separators (backslashes on Windows)
+            # This matches ComfyUI's recursive_search format for get_filename_list
+            relative_path = full_path[base_len:]
+            
+            models.append(ModelRec(filename, full_path, relative_path, category, base_directory))
+    
+    return models
+
+
+def scan_all_directories() -> List[ModelRec]:
     """
     Scan all configured model directories and return list of available models.
     This performs a full scan - use get_model_files() for cached access.
@@ -196,54 +501,110 @@ def scan_all_directories() -> List[Dict[str, str]]:
     Returns:
         List of dictionaries with model information (same format as scan_directory)
     """
-    from .config_loader import load_config, get_additional_directories
+    from .config_loader import load_config
     
     # Load configuration
     config = load_config()
+    tasks = _get_scan_tasks(config)
+    
+    # Directory walks block on disk I/O, so overlap them across threads
+    # (map() keeps results in task order, so the model list order is unchanged)
+    workers = _get_scan_workers(config)
+    if len(tasks) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_scan_task, tasks))
+    else:
+        results = [_scan_task(task) for task in tasks]
+    
+    all_models = list(itertools.chain.from_iterable(results))
+    
+    logging.info(f"Model Linker: Total models found: {len(all_models)}")
+    return all_models
+
+
+def _get_scan_tasks(config: Dict) -> List[Tuple[str, str, set, str]]:
+    """
+    Collect the directories scan_all_directories walks.
+    
+    Args:
+        config: Configuration dictionary from load_config()
+        
+    Returns:
+        List of (category, directory, extensions, source) scan tasks
+    """
+    from .config_loader import get_additional_directories
     
     # Get additional directories from config
     additional_dirs = get_additional_directories(config)
     
     # Get base directories from folder_paths
-    all_models = []
     directories = get_model_directories()
     
     logging.info(f"Model Linker: Scanning {len(directories)} model categories")
     
-    # Scan standard directories
+    # Collect (category, directory, extensions, source) scan tasks
+    tasks = []
+    
+    # Standard directories
     for category, (paths, extensions) in directories.items():
         # Skip categories that aren't typically model directories
-        if category in ['custom_nodes', 'configs']:
+        if category in SKIP_CATEGORIES:
             continue
-            
+        
         for directory_path in paths:
-            try:
-                # Normalize path
-                if not os.path.isabs(directory_path):
-                    # If relative, try to resolve it
-                    directory_path = os.path.abspath(directory_path)
-                
-                models = scan_directory(directory_path, extensions, category)
-                all_models.extend(models)
-                logging.info(f"Model Linker: Found {len(models)} models in {category} -> {directory_path}")
-            except Exception as e:
-                logging.warning(f"Model Linker: Error scanning {category} directory {directory_path}: {e}")
-    
-    # Scan additional directories from config (treat as checkpoints by default)
+            # Normalize path
+            if not os.path.isabs(directory_path):
+                # If relative, try to resolve it
+                directory_path = os.path.abspath(directory_path)
+            tasks.append((category, directory_path, extensions, category))
+    
+    # Additional directories from config (treat as checkpoints by default)
     if additional_dirs:
         logging.info(f"Model Linker: Scanning {len(additional_dirs)} additional directories")
         for add_dir in additional_dirs:
-            try:
-                # Scan as checkpoints category (most common)
-                # Users can organize subdirectories if needed
-                models = scan_directory(add_dir, MODEL_EXTENSIONS, 'checkpoints')
-                all_models.extend(models)
-                logging.info(f"Model Linker: Found {len(models)} models in additional directory -> {add_dir}")
-            except Exception as e:
-                logging.warning(f"Model Linker: Error scanning additional directory {add_dir}: {e}")
+            # Scan as checkpoints category (most common)
+            # Users can organize subdirectories if needed
+            tasks.append(('checkpoints', add_dir, MODEL_EXTENSIONS, 'additional directory'))
     
-    logging.info(f"Model Linker: Total models found: {len(all_models)}")
-    return all_models
+    return tasks
+
+
+def _get_scan_workers(config: Dict) -> int:
+    """
+    Get the number of scan threads from the scanning.workers config value.
+    
+    Args:
+        config: Configuration dictionary from load_config()
+        
+    Returns:
+        Worker count clamped to 1..MAX_SCAN_WORKERS (SCAN_WORKERS if unset or invalid)
+    """
+    try:
+        workers = int(config.get('scanning', {}).get('workers', SCAN_WORKERS))
+    except (TypeError, ValueError):
+        logging.warning("Model Linker: Invalid scanning.workers config value, using default")
+        return SCAN_WORKERS
+    return max(1, min(workers, MAX_SCAN_WORKERS))
+
+
+def _scan_task(task: Tuple[str, str, set, str]) -> List[ModelRec]:
+    """
+    Scan one directory for scan_all_directories, logging instead of raising.
+    
+    Args:
+        task: (category, directory, extensions, source) tuple; source is used in log messages
+        
+    Returns:
+        List of model dictionaries (empty on error)
+    """
+    category, directory_path, extensions, source = task
+    try:
+        models = scan_directory(directory_path, extensions, category)
+        logging.info(f"Model Linker: Found {len(models)} models in {source} -> {directory_path}")
+        return models
+    except Exception as e:
+        logging.warning(f"Model Linker: Error scanning {source} directory {directory_path}: {e}")
+        return []
 
 
 # In-memory cache for models (built on first use, persists for session)
@@ -251,7 +612,7 @@ _model_cache = None
 _cache_timestamp = 0
 
 
-def get_model_files(use_cache: bool = True, force_refresh: bool = False) -> List[Dict[str, str]]:
+def get_model_files(use_cache: bool = True, force_refresh: bool = False) -> List[ModelRec]:
     """
     Get list of all available model files with metadata.
     
@@ -263,7 +624,7 @@ def get_model_files(use_cache: bool = True, force_refresh: bool = False) -> List
         force_refresh: If True, force a fresh scan even if cache exists
     
     Returns:
-        List of model dictionaries (same format as scan_directory)
+        List of ModelRec records (same format as scan_directory)
     """
     global _model_cache, _cache_timestamp
     
@@ -280,15 +641,41 @@ def get_model_files(use_cache: bool = True, force_refresh: bool = False) -> List
     if use_cache:
         _model_cache = models
         _cache_timestamp = time.time()
+        # Filenames memoized by the matcher belong to the previous model list
+        from .matcher import clear_caches
+        clear_caches()
         logging.info(f"Model Linker: Cached {len(models)} models in memory")
     
     return models
 
 
+def get_model_cache_info() -> Dict[str, float]:
+    """
+    Get version info for the in-memory model cache.
+    
+    Returns:
+        Dictionary with 'last_updated' (timestamp, 0 if not cached) and 'count'
+    """
+    return {
+        'last_updated': _cache_timestamp,
+        'count': len(_model_cache) if _model_cache is not None else 0
+    }
+
+
 def clear_model_cache():
-    """Clear the in-memory model cache (forces fresh scan on next call)."""
+    """
+    Clear the in-memory model cache (forces fresh scan on next call).
+    
+    Also drops the cached directory listings and scan results (see invalidate()),
+    so the next scan lists every folder again, and the memoized config file paths.
+    """
+    from .config_loader import invalidate_path_caches
+    
     global _model_cache, _cache_timestamp
     _model_cache = None
     _cache_timestamp = 0
+    invalidate()
+    # Config files may have been added or moved since they were looked up
+    invalidate_path_caches()
     logging.info("Model Linker: Cleared in-memory cache")
 
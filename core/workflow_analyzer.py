@@ -7,7 +7,10 @@ Supports both API format and Graph format workflows.
 
 import os
 import logging
-from typing import List, Dict, Any, Optional
+import functools
+from typing import List, Dict, Any, Optional, Tuple
+
+from .constants import MODEL_EXTENSIONS, SKIP_CATEGORIES
 
 # Import folder_paths lazily - it may not be available until ComfyUI is initialized
 try:
@@ -17,9 +20,6 @@ except ImportError:
     logging.warning("Model Linker: folder_paths not available yet - will retry later")
 
 
-# Common model file extensions
-MODEL_EXTENSIONS = {'.ckpt', '.pt', '.pt2', '.bin', '.pth', '.safetensors', '.pkl', '.sft', '.onnx'}
-
 # Mapping of common node types to their expected model category
 NODE_TYPE_TO_CATEGORY_HINTS = {
     'CheckpointLoaderSimple': 'checkpoints',
@@ -46,6 +46,15 @@ MODEL_INPUT_FIELDS = {
     'upscale_model', 'hypernetwork_name', 'embedding_name'
 }
 
+# Reverse index of scanned models: normalized relative path -> [(category, full_path), ...]
+# Rebuilt whenever the scanner returns a new model list (see _get_path_index)
+_path_index_source = None
+_path_index: Dict[str, List[Tuple[str, str]]] = {}
+
+# folder_paths' model categories (SKIP_CATEGORIES removed), snapshotted on first use
+# and reset when the scanner's model list changes
+_categories_cache: Optional[Tuple[str, ...]] = None
+
 
 def is_model_filename(value: Any) -> bool:
     """
@@ -60,21 +69,99 @@ def is_model_filename(value: Any) -> bool:
     if not isinstance(value, str):
         return False
     
-    # Check if it ends with a model extension
-    _, ext = os.path.splitext(value.lower())
-    return ext in MODEL_EXTENSIONS
+    # Only the text after the last dot can be a model extension, so that is all that
+    # gets lowercased - widget values include multi-KB prompts
+    dot = value.rfind('.')
+    if dot < 0 or value[dot:].lower() not in MODEL_EXTENSIONS:
+        return False
+    
+    # splitext treats a leading dot as part of the name (".safetensors" has no extension)
+    return bool(os.path.splitext(value)[1])
 
 
-def try_resolve_model_path(value: str, categories: List[str] = None) -> Optional[tuple[str, str]]:
+@functools.lru_cache(maxsize=1024)
+def _is_model_field(field_name: str) -> bool:
+    """Check if an API-format input name suggests a model reference (names repeat across nodes, so cached)."""
+    name = field_name.lower()
+    return name in MODEL_INPUT_FIELDS or name.endswith('_name')
+
+
+def _path_key(path: str) -> str:
+    """Normalize a model path relative to its category directory for index lookups."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _get_path_index() -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Get the reverse index of scanned models, keyed by relative path (see _path_key).
+    
+    Built once from the scanner's cached model list, in scan order (folder_paths'
+    category order, then base directory order - the order get_full_path probes).
+    Only models under one of folder_paths' directories for their category are
+    indexed - the scanner also lists additional_directories and YAML-only
+    categories, which get_full_path (and so ComfyUI) can't load from.
+    
+    Returns:
+        Dict of normalized relative path -> list of (category, full_path)
+    """
+    global _path_index_source, _path_index, _categories_cache
+    if not _ensure_folder_paths():
+        return {}
+    try:
+        from .scanner import get_model_files
+        models = get_model_files()
+    except Exception as e:
+        logging.debug(f"Model Linker: Model index unavailable: {e}")
+        return {}
+    
+    if models is not _path_index_source:
+        index = {}
+        loadable_dirs = {}
+        for model in models:
+            category = model['category']
+            if category in SKIP_CATEGORIES:
+                continue
+            if category not in loadable_dirs:
+                try:
+                    loadable_dirs[category] = {os.path.abspath(d) for d in folder_paths.get_folder_paths(category)}
+                except KeyError:
+                    # Not a folder_paths category - get_full_path can't resolve it
+                    loadable_dirs[category] = set()
+            if model['base_directory'] in loadable_dirs[category]:
+                index.setdefault(_path_key(model['relative_path']), []).append((category, model['path']))
+        _path_index = index
+        _path_index_source = models
+        _categories_cache = None
+    return _path_index
+
+
+def _ensure_folder_paths() -> bool:
+    """Import folder_paths if the module-level import ran before ComfyUI was ready."""
+    global folder_paths
+    if folder_paths is None:
+        try:
+            import folder_paths as fp
+            folder_paths = fp
+        except ImportError:
+            logging.error("Model Linker: folder_paths not available")
+            return False
+    return True
+
+
+def try_resolve_model_path(value: str, categories: List[str] = None,
+                           resolve_cache: Dict = None) -> Optional[tuple[str, str]]:
     """
     Try to resolve a model path using folder_paths.
     
     Args:
         value: The model filename/path to resolve
         categories: Optional list of categories to try (if None, tries all)
+        resolve_cache: Optional dict that memoizes folder_paths lookups (found or not)
+            for the lifetime of the dict - analyze_workflow_models passes a new one per
+            workflow, so files downloaded in between are picked up
         
     Returns:
-        Tuple of (category, full_path) if found, None otherwise
+        Tuple of (category, full_path) of an existing file if found, None otherwise
     """
     if not isinstance(value, str) or not value.strip():
         return None
@@ -82,23 +169,39 @@ def try_resolve_model_path(value: str, categories: List[str] = None) -> Optional
     # Remove any path separators that might indicate an absolute path prefix
     filename = value.strip()
     
-    # Ensure folder_paths is available
-    global folder_paths
-    if folder_paths is None:
-        try:
-            import folder_paths as fp
-            folder_paths = fp
-        except ImportError:
-            logging.error("Model Linker: folder_paths not available")
-            return None
+    # Models the scanner already found resolve with a dict lookup instead of probing
+    # every category's directories. The scan lasts the whole session, so a hit is still
+    # checked on disk - a model deleted since then falls through to folder_paths
+    for category, full_path in _get_path_index().get(_path_key(filename), ()):
+        if (categories is None or category in categories) and os.path.exists(full_path):
+            return (category, full_path)
     
-    # If categories not provided, try all categories
-    if categories is None:
-        categories = list(folder_paths.folder_names_and_paths.keys())
+    # Missing models tend to be referenced by several nodes - probe each name only once
+    # per workflow
+    cache_key = (filename, tuple(categories) if categories is not None else None)
+    if resolve_cache is not None and cache_key in resolve_cache:
+        return resolve_cache[cache_key]
     
-    # Skip non-model categories
-    skip_categories = {'custom_nodes', 'configs'}
-    categories = [c for c in categories if c not in skip_categories]
+    if not _ensure_folder_paths():
+        return None
+    
+    resolved = _probe_model_path(filename, categories)
+    if resolve_cache is not None:
+        resolve_cache[cache_key] = resolved
+    return resolved
+
+
+def _probe_model_path(filename: str, categories: Optional[List[str]]) -> Optional[Tuple[str, str]]:
+    """Resolve a model path by asking folder_paths for it in each category (see try_resolve_model_path)."""
+    global _categories_cache
+    if categories is None:
+        # If categories not provided, try all (model) categories
+        if _categories_cache is None:
+            _categories_cache = tuple(c for c in folder_paths.folder_names_and_paths if c not in SKIP_CATEGORIES)
+        categories = _categories_cache
+    else:
+        # Skip non-model categories
+        categories = [c for c in categories if c not in SKIP_CATEGORIES]
     
     for category in categories:
         try:
@@ -124,24 +227,26 @@ def detect_workflow_format(workflow_json: Dict[str, Any]) -> str:
     # API format: keys are node IDs (numbers as strings), values have 'class_type' and 'inputs'
     # Graph format: has 'nodes' array with objects containing 'type' and 'widgets_values'
     
-    if 'nodes' in workflow_json and isinstance(workflow_json['nodes'], list):
+    if isinstance(workflow_json.get('nodes'), list):
         return 'graph'
     
-    # Check if it looks like API format
-    for key, value in workflow_json.items():
-        if isinstance(value, dict) and 'class_type' in value and 'inputs' in value:
-            return 'api'
+    # Check if it looks like API format - stops at the first node-shaped value
+    if any(isinstance(value, dict) and 'class_type' in value and 'inputs' in value
+           for value in workflow_json.values()):
+        return 'api'
     
     return 'unknown'
 
 
-def get_node_model_info_api(node_id: str, node_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_node_model_info_api(node_id: str, node_data: Dict[str, Any],
+                            resolve_cache: Dict = None) -> List[Dict[str, Any]]:
     """
     Extract model references from a single node in API format.
     
     Args:
         node_id: Node ID (string)
         node_data: Node data dictionary with 'class_type' and 'inputs'
+        resolve_cache: Optional per-workflow lookup cache (see try_resolve_model_path)
         
     Returns:
         List of model reference dictionaries
@@ -164,19 +269,16 @@ def get_node_model_info_api(node_id: str, node_data: Dict[str, Any]) -> List[Dic
             continue
             
         # Check if this field name suggests it's a model reference
-        is_model_field = (field_name.lower() in MODEL_INPUT_FIELDS or 
-                         field_name.lower().endswith('_name') or
-                         is_model_filename(value))
-        
-        if not is_model_field:
+        if not (_is_model_field(field_name) or is_model_filename(value)):
             continue
         
         # Try to resolve the model path
-        resolved = try_resolve_model_path(value, categories_to_try)
+        resolved = try_resolve_model_path(value, categories_to_try, resolve_cache)
         
         if resolved:
             category, full_path = resolved
-            exists = os.path.exists(full_path)
+            # try_resolve_model_path has just checked that the path exists
+            exists = True
         else:
             # If we can't resolve it, check if it at least looks like a model filename
             category = category_hint or 'unknown'
@@ -197,12 +299,13 @@ def get_node_model_info_api(node_id: str, node_data: Dict[str, Any]) -> List[Dic
     return model_refs
 
 
-def get_node_model_info_graph(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_node_model_info_graph(node: Dict[str, Any], resolve_cache: Dict = None) -> List[Dict[str, Any]]:
     """
     Extract model references from a single node in Graph format.
     
     Args:
         node: Node dictionary from workflow JSON
+        resolve_cache: Optional per-workflow lookup cache (see try_resolve_model_path)
         
     Returns:
         List of model reference dictionaries
@@ -225,11 +328,12 @@ def get_node_model_info_graph(node: Dict[str, Any]) -> List[Dict[str, Any]]:
             continue
         
         # Try to resolve the model path
-        resolved = try_resolve_model_path(value, categories_to_try)
+        resolved = try_resolve_model_path(value, categories_to_try, resolve_cache)
         
         if resolved:
             category, full_path = resolved
-            exists = os.path.exists(full_path)
+            # try_resolve_model_path has just checked that the path exists
+            exists = True
         else:
             category = category_hint or 'unknown'
             full_path = None
@@ -260,6 +364,10 @@ def analyze_workflow_models(workflow_json: Dict[str, Any]) -> List[Dict[str, Any
     """
     all_model_refs = []
     
+    # Shared by every node of this workflow only, so a model downloaded since the last
+    # analysis isn't reported missing from a stale lookup
+    resolve_cache = {}
+    
     # Detect workflow format
     format_type = detect_workflow_format(workflow_json)
     logging.info(f"Model Linker: Detected workflow format: {format_type}")
@@ -269,7 +377,7 @@ def analyze_workflow_models(workflow_json: Dict[str, Any]) -> List[Dict[str, Any
         for node_id, node_data in workflow_json.items():
             if isinstance(node_data, dict) and 'class_type' in node_data:
                 try:
-                    model_refs = get_node_model_info_api(node_id, node_data)
+                    model_refs = get_node_model_info_api(node_id, node_data, resolve_cache)
                     all_model_refs.extend(model_refs)
                 except Exception as e:
                     logging.warning(f"Error analyzing API node {node_id}: {e}")
@@ -280,7 +388,7 @@ def analyze_workflow_models(workflow_json: Dict[str, Any]) -> List[Dict[str, Any
         nodes = workflow_json.get('nodes', [])
         for node in nodes:
             try:
-                model_refs = get_node_model_info_graph(node)
+                model_refs = get_node_model_info_graph(node, resolve_cache)
                 all_model_refs.extend(model_refs)
             except Exception as e:
                 logging.warning(f"Error analyzing graph node {node.get('id', 'unknown')}: {e}")
@@ -297,7 +405,7 @@ def analyze_workflow_models(workflow_json: Dict[str, Any]) -> List[Dict[str, Any
             
             for node in subgraph_nodes:
                 try:
-                    model_refs = get_node_model_info_graph(node)
+                    model_refs = get_node_model_info_graph(node, resolve_cache)
                     # Mark as belonging to this subgraph
                     for ref in model_refs:
                         ref['subgraph_id'] = subgraph_id
@@ -328,11 +436,5 @@ def identify_missing_models(
     Returns:
         List of missing model references (filtered to only missing ones)
     """
-    missing = []
-    
-    for model_ref in workflow_models:
-        # If exists is False, it's missing
-        if not model_ref.get('exists', False):
-            missing.append(model_ref)
-    
-    return missing
\ No newline at end of file
+    # If exists is False, it's missing
+    return [model_ref for model_ref in workflow_models if not model_ref.get('exists', False)]
\ No newline at end of file
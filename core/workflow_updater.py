@@ -116,7 +116,8 @@ def update_model_path(
     base_directory: str = None,
     resolved_model: Dict[str, Any] = None,
     subgraph_id: str = None,
-    is_top_level: bool = None
+    is_top_level: bool = None,
+    patch: Optional[List[Dict[str, Any]]] = None
 ) -> bool:
     """
     Update a single model path in a workflow node, supporting both top-level and subgraph nodes.
@@ -132,11 +133,13 @@ def update_model_path(
         subgraph_id: ID of the subgraph (UUID for subgraph type, or None)
         is_top_level: True if this is a top-level node (even if it's a subgraph instance), 
                      False if it's inside a subgraph definition, None to auto-detect
+        patch: Optional list to append a JSON Patch (RFC 6902) 'replace' op to
         
     Returns:
         True if update was successful, False otherwise
     """
     node = None
+    node_pointer = None  # JSON Pointer to the node, for patch ops
     
     # Determine if this is a top-level node or inside a subgraph definition
     # - If is_top_level is True, it's a top-level node (even if it's a subgraph instance)
@@ -172,20 +175,22 @@ def update_model_path(
         definitions = workflow.get('definitions', {})
         subgraphs = definitions.get('subgraphs', [])
         
-        for subgraph in subgraphs:
+        for subgraph_index, subgraph in enumerate(subgraphs):
             if subgraph.get('id') == subgraph_id:
                 subgraph_nodes = subgraph.get('nodes', [])
-                for n in subgraph_nodes:
+                for node_index, n in enumerate(subgraph_nodes):
                     if n.get('id') == node_id:
                         node = n
+                        node_pointer = f"/definitions/subgraphs/{subgraph_index}/nodes/{node_index}"
                         break
                 break
     else:
         # Find in top-level nodes
         nodes = workflow.get('nodes', [])
-        for n in nodes:
+        for node_index, n in enumerate(nodes):
             if n.get('id') == node_id:
                 node = n
+                node_pointer = f"/nodes/{node_index}"
                 break
     
     if not node:
@@ -219,13 +224,21 @@ def update_model_path(
     # Update the widget value
     widgets_values[widget_index] = relative_path
     
+    if patch is not None:
+        patch.append({
+            'op': 'replace',
+            'path': f"{node_pointer}/widgets_values/{widget_index}",
+            'value': relative_path
+        })
+    
     logging.debug(f"Updated node {node_id}, widget {widget_index} to: {relative_path}")
     return True
 
 
 def update_workflow_nodes(
     workflow: Dict[str, Any],
-    mappings: List[Dict[str, Any]]
+    mappings: List[Dict[str, Any]],
+    patch: Optional[List[Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Apply multiple model path changes to a workflow.
@@ -241,6 +254,7 @@ def update_workflow_nodes(
                 'base_directory': base directory for category (optional),
                 'resolved_model': model dict from scanner (optional, for base_directory)
             }
+        patch: Optional list that receives a JSON Patch (RFC 6902) op for every change
             
     Returns:
         Updated workflow dictionary (same reference, modified in place)
@@ -277,7 +291,8 @@ def update_workflow_nodes(
             base_directory,
             resolved_model,
             subgraph_id,
-            is_top_level
+            is_top_level,
+            patch
         )
         
         if success:
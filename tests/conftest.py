@@ -0,0 +1,104 @@
+"""
+Shared test setup.
+
+ComfyUI's folder_paths and server modules only exist inside a running ComfyUI, so
+minimal stand-ins are installed before the extension is imported. folder_paths
+points at a fresh temporary models directory for every test (see models_dir).
+"""
+
+import os
+import sys
+import types
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# --- folder_paths stand-in ---------------------------------------------------
+
+folder_paths = types.ModuleType('folder_paths')
+folder_paths.folder_names_and_paths = {}
+folder_paths.base_path = str(ROOT)
+
+
+def _get_folder_paths(category):
+    # Raises KeyError for unknown categories, like ComfyUI's
+    return folder_paths.folder_names_and_paths[category][0]
+
+
+def _get_full_path(category, filename):
+    for directory in folder_paths.folder_names_and_paths.get(category, ([], set()))[0]:
+        path = os.path.join(directory, filename)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+folder_paths.get_folder_paths = _get_folder_paths
+folder_paths.get_full_path = _get_full_path
+folder_paths.get_user_directory = lambda: os.path.join(folder_paths.base_path, 'user')
+sys.modules['folder_paths'] = folder_paths
+
+# --- server stand-in (PromptServer.instance.app is where routes are added) ---
+
+server = types.ModuleType('server')
+
+
+class PromptServer:
+    instance = types.SimpleNamespace(app=web.Application())
+
+
+server.PromptServer = PromptServer
+sys.modules['server'] = server
+
+# --- the extension itself, imported as a package from the repo root ----------
+
+_spec = importlib.util.spec_from_file_location(
+    'model_linker', ROOT / '__init__.py', submodule_search_locations=[str(ROOT)])
+linker = importlib.util.module_from_spec(_spec)
+sys.modules['model_linker'] = linker
+_spec.loader.exec_module(linker)
+
+from model_linker.core import matcher, scanner  # noqa: E402
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    """A models directory with empty checkpoints/ and loras/ folders registered in folder_paths."""
+    models = tmp_path / 'models'
+    folder_paths.folder_names_and_paths = {}
+    for category in ('checkpoints', 'loras'):
+        (models / category).mkdir(parents=True)
+        folder_paths.folder_names_and_paths[category] = ([str(models / category)], {'.safetensors', '.ckpt'})
+    folder_paths.base_path = str(tmp_path)
+    
+    scanner.clear_model_cache()
+    matcher.clear_caches()
+    linker.active_downloads.clear()
+    yield models
+    scanner.clear_model_cache()
+
+
+@pytest.fixture
+def run_api(models_dir):
+    """
+    Run a coroutine against the extension's routes.
+    
+    Routes are registered on a fresh aiohttp app, and the coroutine is called with a
+    TestClient for it: run_api(lambda client: ...) returns the coroutine's result.
+    """
+    def run(scenario):
+        async def main():
+            app = web.Application()
+            PromptServer.instance = types.SimpleNamespace(app=app)
+            linker._routes_registered = False
+            assert linker.register_api_routes()
+            async with TestClient(TestServer(app)) as client:
+                return await scenario(client)
+        return asyncio.run(main())
+    return run
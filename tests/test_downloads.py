@@ -0,0 +1,225 @@
+"""Download routes: single downloads, Range/If-Range resume, batches and cancellation."""
+
+import os
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import model_linker as linker
+
+PAYLOAD = os.urandom((3 << 20) + 12345)
+
+
+class Origin:
+    """
+    A file server for download tests.
+    
+    Honours Range only while If-Range matches the current ETag, can cut the
+    connection after drop_at bytes once, and can pace the body with delay.
+    """
+    
+    def __init__(self, body=PAYLOAD, etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.drop_at = None
+        self.delay = 0
+        self.requests = []  # (Range, If-Range, status) of every GET
+    
+    async def handle(self, request):
+        body = self.body
+        headers = {'ETag': self.etag, 'Accept-Ranges': 'bytes'}
+        if request.method == 'HEAD':
+            return web.Response(headers={**headers, 'Content-Length': str(len(body))})
+        
+        start = 0
+        status = 200
+        range_header = request.headers.get('Range')
+        if range_header and request.headers.get('If-Range', self.etag) == self.etag:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            status = 206
+            headers['Content-Range'] = f'bytes {start}-{len(body) - 1}/{len(body)}'
+        self.requests.append((range_header, request.headers.get('If-Range'), status))
+        
+        response = web.StreamResponse(status=status, headers={**headers, 'Content-Length': str(len(body) - start)})
+        await response.prepare(request)
+        data = body[start:]
+        if self.drop_at is not None:
+            await response.write(data[:self.drop_at])
+            self.drop_at = None
+            request.transport.close()
+            return response
+        for offset in range(0, len(data), 1 << 16):
+            await response.write(data[offset:offset + (1 << 16)])
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        await response.write_eof()
+        return response
+    
+    async def start(self):
+        app = web.Application()
+        app.router.add_route('*', '/file', self.handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        return str(self.server.make_url('/file'))
+
+
+async def wait_for(client, path):
+    """Poll a progress route until the download (or batch) has finished."""
+    for _ in range(500):
+        response = await client.get(path)
+        progress = await response.json()
+        if progress.get('status') not in ('downloading', 'cancelling'):
+            return progress
+        await asyncio.sleep(0.01)
+    raise AssertionError(f'{path} did not finish: {progress}')
+
+
+async def download(client, url, filename, download_id):
+    response = await client.post('/model_linker/download', json={
+        'url': url, 'filename': filename, 'category': 'loras', 'download_id': download_id})
+    assert response.status == 200, await response.text()
+    return await wait_for(client, f'/model_linker/download/{download_id}/progress')
+
+
+def test_download_completes(run_api, models_dir):
+    async def scenario(client):
+        origin = Origin()
+        url = await origin.start()
+        progress = await download(client, url, 'model.safetensors', 'd1')
+        await origin.server.close()
+        return progress
+    
+    progress = run_api(scenario)
+    assert progress['status'] == 'completed'
+    assert (models_dir / 'loras' / 'model.safetensors').read_bytes() == PAYLOAD
+    assert not (models_dir / 'loras' / 'model.safetensors.tmp').exists()
+
+
+def test_interrupted_download_resumes_with_if_range(run_api, models_dir):
+    temp = models_dir / 'loras' / 'model.safetensors.tmp'
+    meta = models_dir / 'loras' / 'model.safetensors.tmp.meta'
+    
+    async def scenario(client):
+        origin = Origin()
+        url = await origin.start()
+        origin.drop_at = 1_500_000
+        first = await download(client, url, 'model.safetensors', 'd1')
+        kept = (temp.stat().st_size, meta.exists())
+        second = await download(client, url, 'model.safetensors', 'd2')
+        await origin.server.close()
+        return first, kept, second, origin.requests
+    
+    first, kept, second, requests = run_api(scenario)
+    assert first['status'] == 'failed'
+    assert kept == (1_500_000, True)
+    assert second['status'] == 'completed'
+    assert requests[-1] == ('bytes=1500000-', '"v1"', 206)
+    assert (models_dir / 'loras' / 'model.safetensors').read_bytes() == PAYLOAD
+    assert not temp.exists() and not meta.exists()
+
+
+def test_changed_file_is_downloaded_from_scratch(run_api, models_dir):
+    new_body = os.urandom(len(PAYLOAD))
+    
+    async def scenario(client):
+        origin = Origin()
+        url = await origin.start()
+        origin.drop_at = 1_000_000
+        await download(client, url, 'model.safetensors', 'd1')
+        origin.body, origin.etag = new_body, '"v2"'
+        progress = await download(client, url, 'model.safetensors', 'd2')
+        await origin.server.close()
+        return progress, origin.requests
+    
+    progress, requests = run_api(scenario)
+    assert progress['status'] == 'completed'
+    assert requests[-1][2] == 200
+    assert (models_dir / 'loras' / 'model.safetensors').read_bytes() == new_body
+
+
+def test_partial_without_resume_info_is_discarded(run_api, models_dir):
+    (models_dir / 'loras' / 'model.safetensors.tmp').write_bytes(os.urandom(1_000_000))
+    
+    async def scenario(client):
+        origin = Origin()
+        url = await origin.start()
+        progress = await download(client, url, 'model.safetensors', 'd1')
+        await origin.server.close()
+        return progress, origin.requests
+    
+    progress, requests = run_api(scenario)
+    assert progress['status'] == 'completed'
+    assert requests == [(None, None, 200)]
+    assert (models_dir / 'loras' / 'model.safetensors').read_bytes() == PAYLOAD
+
+
+def test_cancelled_download_reports_cancelled(run_api, models_dir):
+    async def scenario(client):
+        origin = Origin()
+        origin.delay = 0.01
+        url = await origin.start()
+        await client.post('/model_linker/download', json={
+            'url': url, 'filename': 'model.safetensors', 'category': 'loras', 'download_id': 'd1'})
+        await asyncio.sleep(0.1)
+        await client.post('/model_linker/download/d1/cancel')
+        progress = await wait_for(client, '/model_linker/download/d1/progress')
+        await origin.server.close()
+        return progress
+    
+    assert run_api(scenario) == {'status': 'cancelled'}
+    assert os.listdir(models_dir / 'loras') == []
+
+
+def test_batch_downloads_and_fails_invalid_entries_individually(run_api, models_dir):
+    (models_dir / 'loras' / 'existing.safetensors').write_bytes(b'x')
+    
+    async def scenario(client):
+        origin = Origin()
+        url = await origin.start()
+        response = await client.post('/model_linker/download/batch', json={'batch_id': 'b1', 'tasks': [
+            {'url': url, 'filename': 'a.safetensors', 'category': 'loras', 'download_id': '1'},
+            {'url': url, 'filename': 'b.safetensors', 'category': 'loras', 'download_id': '1'},
+            {'url': url, 'filename': 'existing.safetensors', 'category': 'loras'},
+            {'url': url, 'filename': 'c.safetensors', 'category': 'not_a_category'},
+            'not an object',
+        ]})
+        started = await response.json()
+        progress = await wait_for(client, '/model_linker/download/batch/b1/progress')
+        await origin.server.close()
+        return response.status, started, progress
+    
+    status, started, progress = run_api(scenario)
+    assert status == 200
+    # Children are keyed by position, so repeated or index-like download_ids don't collide
+    assert list(started['children']) == ['0', '1', '2', '3', '4']
+    assert [child['status'] for child in started['children'].values()] == [
+        'queued', 'queued', 'failed', 'failed', 'failed']
+    assert started['children']['1']['download_id'] == '1'
+    
+    assert progress['status'] == 'completed'
+    assert (progress['succeeded'], progress['failed']) == (2, 3)
+    assert progress['children']['0']['status'] == 'completed'
+    assert progress['children']['1']['status'] == 'completed'
+    assert (models_dir / 'loras' / 'a.safetensors').read_bytes() == PAYLOAD
+    assert (models_dir / 'loras' / 'b.safetensors').read_bytes() == PAYLOAD
+
+
+def test_batch_cancel_reports_cancelled(run_api, models_dir):
+    async def scenario(client):
+        origin = Origin()
+        origin.delay = 0.01
+        url = await origin.start()
+        tasks = [{'url': url, 'filename': f'm{i}.safetensors', 'category': 'loras'} for i in range(6)]
+        await client.post('/model_linker/download/batch', json={'batch_id': 'b1', 'tasks': tasks})
+        await asyncio.sleep(0.1)
+        await client.post('/model_linker/download/b1/cancel')
+        progress = await wait_for(client, '/model_linker/download/batch/b1/progress')
+        await origin.server.close()
+        return progress
+    
+    progress = run_api(scenario)
+    assert progress['status'] == 'cancelled'
+    assert {child['status'] for child in progress['children'].values()} == {'cancelled'}
+    assert os.listdir(models_dir / 'loras') == []
+    assert 'b1' not in linker.active_downloads
@@ -0,0 +1,95 @@
+"""find_matches with the inverted index must rank exactly like scoring every candidate."""
+
+import os
+import random
+
+import pytest
+
+from model_linker.core import matcher
+from model_linker.core.matcher import (
+    build_index, calculate_similarity, calculate_similarity_with_normalization, find_matches,
+    normalize_filename,
+)
+
+WORDS = ['sdxl', 'base', 'refiner', 'v1', 'v2', '1.0', 'wan2.1', 'flux', 'dev', 'schnell', 'fp16', 'fp8',
+         'lora', 'vae', 'pony', 'realistic', 'vision', 't5xxl', 'clip', 'unet', 'i2v', '14b', 'e4m3fn']
+EXTENSIONS = ['.safetensors', '.ckpt', '.pt', '.bin']
+
+
+def make_candidates(count=600, seed=7):
+    rng = random.Random(seed)
+    candidates = []
+    for _ in range(count):
+        separator = rng.choice(['_', '-', ' '])
+        filename = separator.join(rng.sample(WORDS, rng.randint(1, 5))) + rng.choice(EXTENSIONS)
+        candidates.append({'filename': filename, 'path': '/models/' + filename, 'category': 'checkpoints'})
+    return candidates
+
+
+def brute_force(target, candidates, threshold, max_results=10):
+    """Score every candidate pair by pair (exact normalized matches alone win, as documented)."""
+    target_filename = os.path.basename(target)
+    target_norm = normalize_filename(target_filename)
+    scored = []
+    for candidate in candidates:
+        filename = candidate['filename']
+        if normalize_filename(filename) == target_norm:
+            similarity = 1.0
+        else:
+            similarity = min(0.999, max(
+                calculate_similarity_with_normalization(target_filename, filename),
+                calculate_similarity_with_normalization(os.path.splitext(target_filename)[0],
+                                                        os.path.splitext(filename)[0])))
+        if similarity >= threshold:
+            scored.append((filename, similarity))
+    
+    exact = [match for match in scored if match[1] == 1.0]
+    if exact:
+        return exact[:max_results]
+    return sorted(scored, key=lambda match: -match[1])[:max_results]
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    matcher.clear_caches()
+    yield
+    matcher.clear_caches()
+
+
+@pytest.mark.parametrize('threshold', [0.0, 0.5, 0.7, 0.85])
+def test_indexed_find_matches_equals_brute_force(threshold):
+    candidates = make_candidates()
+    targets = [candidate['filename'] for candidate in random.Random(3).sample(candidates, 25)]
+    targets += ['sd_xl_base_1.0.safetensors', 'flux1-dev-fp8.safetensors', 'loras/sub/wan2.1_i2v_14b.pt',
+                'FLUX_DEV.SAFETENSORS', 'x']
+    
+    build_index(candidates)
+    for target in targets:
+        matches = find_matches(target, candidates, threshold)
+        assert [(m['filename'], m['similarity']) for m in matches] == brute_force(target, candidates, threshold), target
+
+
+def test_unindexed_candidates_are_still_matched():
+    candidates = make_candidates()
+    build_index(candidates)
+    extra = {'filename': 'brand_new_model_v3.safetensors', 'path': '/models/brand_new_model_v3.safetensors'}
+    
+    matches = find_matches('brand-new-model-v3.safetensors', candidates + [extra], threshold=0.8)
+    assert matches[0]['model'] is extra
+    assert matches[0]['confidence'] == 100.0
+
+
+@pytest.mark.parametrize('pair', [('', ''), ('a', ''), ('sdxl_base', 'sdxl-refiner'), ('flux1dev', 'fluxdev1'),
+                                  ('wan2.1_i2v_14b', 'wan2.2_t2v_14b')])
+def test_similarity_is_the_normalized_indel_ratio(pair):
+    first, second = pair
+    total = len(first) + len(second)
+    # Longest common subsequence by dynamic programming
+    lcs = [[0] * (len(second) + 1) for _ in range(len(first) + 1)]
+    for i, a in enumerate(first):
+        for j, b in enumerate(second):
+            lcs[i + 1][j + 1] = lcs[i][j] + 1 if a == b else max(lcs[i][j + 1], lcs[i + 1][j])
+    expected = 1.0 if not total else 2 * lcs[-1][-1] / total
+    assert calculate_similarity(first, second) == pytest.approx(expected)
+    # The pure-Python scorer used when rapidfuzz isn't installed
+    assert matcher._indel_similarity(matcher._lcs_masks(first), len(first), second) == pytest.approx(expected)
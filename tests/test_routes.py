@@ -0,0 +1,94 @@
+"""Workflow routes: analyze, resolve (JSON Patch) and the ETag'd model list."""
+
+import copy
+
+from model_linker.core.linker import apply_resolution
+
+WORKFLOW = {
+    'nodes': [
+        {'id': 1, 'type': 'CheckpointLoaderSimple', 'widgets_values': ['sd_xl_base_1.0.safetensors']},
+        {'id': 2, 'type': 'CheckpointLoaderSimple', 'widgets_values': ['flux1_dev.safetensors']},
+        {'id': 3, 'type': 'LoraLoader', 'widgets_values': ['missing_lora.safetensors', 1.0, 1.0]},
+    ]
+}
+
+
+def apply_patch(document, patch):
+    """Apply the 'replace' operations of an RFC 6902 patch."""
+    for operation in patch:
+        assert operation['op'] == 'replace'
+        *parents, last = operation['path'].lstrip('/').split('/')
+        target = document
+        for key in parents:
+            target = target[int(key)] if isinstance(target, list) else target[key]
+        target[int(last) if isinstance(target, list) else last] = operation['value']
+    return document
+
+
+def test_analyze_reports_missing_models_with_matches(run_api, models_dir):
+    (models_dir / 'checkpoints' / 'sd_xl_base_1.0.safetensors').write_bytes(b'x')
+    (models_dir / 'checkpoints' / 'sub').mkdir()
+    (models_dir / 'checkpoints' / 'sub' / 'flux1-dev.safetensors').write_bytes(b'x')
+    
+    async def scenario(client):
+        response = await client.post('/model_linker/analyze', json={'workflow': WORKFLOW})
+        return response.status, await response.json()
+    
+    status, result = run_api(scenario)
+    assert status == 200
+    missing = {model['original_path']: model for model in result['missing_models']}
+    assert set(missing) == {'flux1_dev.safetensors', 'missing_lora.safetensors'}
+    best = missing['flux1_dev.safetensors']['matches'][0]
+    assert (best['filename'], best['confidence']) == ('flux1-dev.safetensors', 100.0)
+
+
+def test_resolve_returns_patch_equivalent_to_full_resolution(run_api, models_dir):
+    resolved = models_dir / 'checkpoints' / 'sub' / 'flux1-dev.safetensors'
+    resolved.parent.mkdir()
+    resolved.write_bytes(b'x')
+    resolutions = [{
+        'node_id': 2,
+        'widget_index': 0,
+        'resolved_path': str(resolved),
+        'category': 'checkpoints',
+        'resolved_model': {'path': str(resolved), 'base_directory': str(models_dir / 'checkpoints')},
+    }]
+    
+    async def scenario(client):
+        response = await client.post('/model_linker/resolve', json={'workflow': WORKFLOW, 'resolutions': resolutions})
+        return response.status, await response.json()
+    
+    status, result = run_api(scenario)
+    assert status == 200 and result['success']
+    assert len(result['patch']) == 1
+    expected = apply_resolution(copy.deepcopy(WORKFLOW), copy.deepcopy(resolutions))
+    assert apply_patch(copy.deepcopy(WORKFLOW), result['patch']) == expected
+
+
+def test_resolve_requires_resolutions(run_api):
+    async def scenario(client):
+        response = await client.post('/model_linker/resolve', json={'workflow': WORKFLOW})
+        return response.status
+    
+    assert run_api(scenario) == 400
+
+
+def test_models_list_revalidates_with_etag(run_api, models_dir):
+    (models_dir / 'loras' / 'a.safetensors').write_bytes(b'x')
+    
+    async def scenario(client):
+        first = await client.get('/model_linker/models')
+        etag = first.headers['ETag']
+        models = await first.json()
+        unchanged = await client.get('/model_linker/models', headers={'If-None-Match': etag})
+        
+        (models_dir / 'loras' / 'b.safetensors').write_bytes(b'x')
+        await client.post('/model_linker/cache/refresh')
+        changed = await client.get('/model_linker/models', headers={'If-None-Match': etag})
+        return models, unchanged.status, changed.status, await changed.json()
+    
+    models, unchanged_status, changed_status, changed_models = run_api(scenario)
+    assert [model['filename'] for model in models] == ['a.safetensors']
+    assert unchanged_status == 304
+    assert changed_status == 200
+    assert sorted(model['filename'] for model in changed_models) == ['a.safetensors', 'b.safetensors']
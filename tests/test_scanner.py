@@ -0,0 +1,46 @@
+"""Scanner caches: mtime revalidation, invalidate() and clear_model_cache()."""
+
+import os
+
+from model_linker.core import scanner
+
+
+def filenames(models):
+    return sorted(model['filename'] for model in models)
+
+
+def test_scan_picks_up_added_and_removed_files(models_dir):
+    loras = str(models_dir / 'loras')
+    (models_dir / 'loras' / 'a.safetensors').write_bytes(b'x')
+    assert filenames(scanner.scan_directory(loras, {'.safetensors'}, 'loras')) == ['a.safetensors']
+    
+    # Adding or removing a file bumps the directory mtime, so the cached scan is redone
+    (models_dir / 'loras' / 'sub').mkdir()
+    (models_dir / 'loras' / 'sub' / 'b.safetensors').write_bytes(b'x')
+    os.remove(models_dir / 'loras' / 'a.safetensors')
+    assert filenames(scanner.scan_directory(loras, {'.safetensors'}, 'loras')) == ['b.safetensors']
+
+
+def test_invalidate_path_drops_only_that_directory(models_dir):
+    loras = str(models_dir / 'loras')
+    checkpoints = str(models_dir / 'checkpoints')
+    scanner.scan_directory(loras, {'.safetensors'}, 'loras')
+    scanner.scan_directory(checkpoints, {'.safetensors'}, 'checkpoints')
+    
+    scanner.invalidate(loras)
+    assert loras not in scanner._dir_cache
+    assert checkpoints in scanner._dir_cache
+    assert all(key[1] != loras for key in scanner._scan_cache)
+
+
+def test_clear_model_cache_drops_listings_and_rescans(models_dir):
+    (models_dir / 'checkpoints' / 'model.safetensors').write_bytes(b'x')
+    models = scanner.get_model_files()
+    assert filenames(models) == ['model.safetensors']
+    assert scanner.get_model_files() is models
+    
+    scanner.clear_model_cache()
+    assert not scanner._dir_cache and not scanner._scan_cache
+    
+    (models_dir / 'loras' / 'lora.safetensors').write_bytes(b'x')
+    assert filenames(scanner.get_model_files()) == ['lora.safetensors', 'model.safetensors']
@@ -497,13 +497,13 @@ class ModelLinkerDialog {
             const data = await response.json();
             console.log("🔗 Resolve response:", data);
             console.log("🔗 Resolve success:", data.success);
-            console.log("🔗 Updated workflow from backend:", data.workflow);
-            console.log("🔗 Updated workflow keys:", data.workflow ? Object.keys(data.workflow) : 'none');
+            console.log("🔗 Patch from backend:", data.patch);
             
             if (data.success) {
                 console.log("🔗 About to update workflow in ComfyUI...");
-                // Update workflow in ComfyUI
-                await this.updateWorkflowInComfyUI(data.workflow);
+                // Backend returns only the changes - apply them to the workflow we sent
+                this.applyWorkflowPatch(workflow, data.patch);
+                await this.updateWorkflowInComfyUI(workflow);
                 console.log("🔗 updateWorkflowInComfyUI() completed");
                 
                 // Force a UI refresh
@@ -730,8 +730,9 @@ class ModelLinkerDialog {
             console.log("🔗 Auto-resolve response:", resolveData);
             
             if (resolveData.success) {
-                // Update workflow in ComfyUI
-                await this.updateWorkflowInComfyUI(resolveData.workflow);
+                // Backend returns only the changes - apply them to the workflow we sent
+                this.applyWorkflowPatch(workflow, resolveData.patch);
+                await this.updateWorkflowInComfyUI(workflow);
                 
                 // Force a UI refresh
                 setTimeout(() => {
@@ -755,6 +756,30 @@ class ModelLinkerDialog {
         }
     }
     
+    applyWorkflowPatch(workflow, patch) {
+        // Apply JSON Patch (RFC 6902) 'replace' ops from the resolve endpoint in place
+        for (const op of patch || []) {
+            if (op.op !== 'replace') {
+                console.warn('🔗 Model Linker: Unsupported patch op:', op);
+                continue;
+            }
+            
+            const keys = op.path.split('/').slice(1).map(k => k.replace(/~1/g, '/').replace(/~0/g, '~'));
+            const last = keys.pop();
+            let target = workflow;
+            for (const key of keys) {
+                target = target?.[key];
+            }
+            
+            if (target === undefined || target === null) {
+                console.warn('🔗 Model Linker: Patch path not found:', op.path);
+                continue;
+            }
+            target[last] = op.value;
+        }
+        return workflow;
+    }
+    
     async updateWorkflowInComfyUI(workflow) {
         console.log("🔗 Updating workflow in ComfyUI...");
         console.log("🔗 Workflow object:", workflow);